@@ -6,48 +6,167 @@ and use prompts from multiple MCP servers.
 """
 
 import asyncio
+import importlib.util
 import json
+import logging
 import os
 import re
+import sys
 import traceback
+from collections import deque
 from contextlib import AsyncExitStack
-from typing import Any, Dict, List, Union
-from urllib.parse import quote
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Union
 
-from dotenv import find_dotenv, load_dotenv
+import httpx
+from dotenv import load_dotenv
 from mcp.types import Prompt, Resource, ResourceTemplate, Tool
 from mcp_multi_server import MultiServerClient
-from openai import OpenAI
+from mcp_multi_server.utils import (
+    extract_template_variables,
+    mcp_tools_to_openai_format,
+    substitute_template_variables,
+)
+from openai import AsyncOpenAI
 
 
-load_dotenv(find_dotenv())
-assert os.getenv("OPENAI_API_KEY"), "Error: OPENAI_API_KEY not found in environment"
+# Prefer orjson for tool argument (de)serialization when available, falling back to the stdlib
+json_loads: Callable[[Union[str, bytes]], Any]
+json_dumps_pretty: Callable[[Any], str]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps_pretty(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_pretty(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Only touch the filesystem when the key isn't already in the environment. DOTENV_PATH points at a
+# specific file; otherwise the repository root .env is used without walking up the directory tree.
+if not os.getenv("OPENAI_API_KEY"):
+    DOTENV_PATH = os.getenv("DOTENV_PATH") or os.path.join(os.path.dirname(__file__), "..", "..", ".env")
+    if os.path.exists(DOTENV_PATH):
+        load_dotenv(DOTENV_PATH, override=False)
 
 MODEL = "gpt-4o"
+# Cheaper model for short turns that don't look like they need any tool
+ROUTER_MODEL = "gpt-4o-mini"
+ROUTER_MAX_CHARS = 200
+MAX_HISTORY_MESSAGES = 40
+MAX_HISTORY_TOKENS = 8000
+# Retries for rate limits (429), timeouts and 5xx errors, with the SDK's exponential backoff and jitter
+MAX_RETRIES = 5
+# Set MCP_CACHE_DISABLE to always fetch prompts and resources from the servers
+CACHE_ENABLED = not os.getenv("MCP_CACHE_DISABLE")
+# Set MCP_CLIENT_DEBUG=1 to echo full tool arguments and retrieved prompt/resource content
+DEBUG = os.getenv("MCP_CLIENT_DEBUG") == "1"
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it httpx stays on HTTP/1.1 keep-alive
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# A directive name may contain spaces and runs up to the next directive or the end of the line
+DIRECTIVE_RE = re.compile(r"\+(prompt|resource|template):\s*(.*?)\s*(?=\+(?:prompt|resource|template):|$)")
+WHITESPACE_RE = re.compile(r"\s+")
+DIRECTIVE_LABELS = {
+    "prompt": ("Prompt", "Retrieved prompt content"),
+    "resource": ("Resource", "Retrieved resource content"),
+    "template": ("Resource Template", "Instantiated template content"),
+}
+
+# Serializes interactive argument entry when several directives are resolved concurrently
+INPUT_LOCK = asyncio.Lock()
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    {"the", "and", "for", "with", "from", "that", "this", "what", "which", "how", "are", "was", "can", "you", "get"}
+)
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin in a worker thread so the event loop keeps running."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+
+def parse_directives(
+    query: str, names: Optional[Mapping[str, Mapping[str, Any]]] = None
+) -> Tuple[List[Tuple[str, str]], str]:
+    """Split leading +prompt:/+resource:/+template: directives from the rest of a line.
+
+    Each directive name runs up to the next directive, so names may contain spaces. The text
+    after the last directive is split into name and question using the longest known name
+    of that kind; without a match the whole text is taken as the name.
 
+    Args:
+        query: Line entered by the user.
+        names: Optional mapping of directive kind to the known names of that kind.
 
-async def search_and_instantiate_prompt(client: MultiServerClient, prompts: List[Prompt], name: str) -> str:
-    """Retrieve a prompt by name from the list of prompts.
+    Returns:
+        Tuple of ((kind, name) directives, remaining question text).
+
+    Examples:
+        >>> parse_directives("+prompt: code review +resource:notes What changed?", {"resource": {"notes": None}})
+        ([('prompt', 'code review'), ('resource', 'notes')], 'What changed?')
+    """
+    query = query.strip()
+    directives: List[Tuple[str, str]] = []
+    position = 0
+    while match := DIRECTIVE_RE.match(query, position):
+        directives.append((match.group(1), match.group(2)))
+        position = match.end()
+    question = query[position:]
+    if directives and names:
+        kind, text = directives[-1]
+        known = names.get(kind, {})
+        # Try the whole text first, then shorter prefixes ending at a word boundary
+        ends = [len(text)] + [match.start() for match in reversed(list(WHITESPACE_RE.finditer(text)))]
+        for end in ends:
+            if text[:end] in known:
+                directives[-1] = (kind, text[:end])
+                question = text[end:].strip()
+                break
+    return directives, question
+
+
+async def search_and_instantiate_prompt(
+    client: MultiServerClient,
+    prompts: Dict[str, Prompt],
+    name: str,
+    cache: Optional[Dict[Tuple[str, FrozenSet[Tuple[str, str]]], str]] = None,
+) -> str:
+    """Retrieve a prompt by name from the prompt lookup table.
 
     Args:
         client: MultiServerClient instance.
-        prompts: List of prompt dictionaries.
+        prompts: Mapping of prompt names to prompts.
         name: Name of the prompt to retrieve.
+        cache: Optional cache of prompt texts keyed by name and arguments.
 
     Returns:
         The prompt text.
 
     """
-    if prompts:
-        for prompt in prompts:
-            if prompt.name == name:
-                prompt_result = await client.get_prompt(name, arguments=get_prompt_arguments(prompt))
-                # Assuming single text message prompt
-                return prompt_result.messages[0].content.text if prompt_result.messages else ""  # type: ignore[union-attr]
-    return ""
-
-
-def get_prompt_arguments(prompt: Prompt) -> dict[str, str]:
+    prompt = prompts.get(name)
+    if prompt is None:
+        return ""
+    async with INPUT_LOCK:
+        arguments = await get_prompt_arguments(prompt)
+    key = (name, frozenset(arguments.items()))
+    if cache is not None and key in cache:
+        return cache[key]
+    prompt_result = await client.get_prompt(name, arguments=arguments)
+    # Assuming single text message prompt
+    text = prompt_result.messages[0].content.text if prompt_result.messages else ""  # type: ignore[union-attr]
+    if cache is not None:
+        cache[key] = text
+    return text
+
+
+async def get_prompt_arguments(prompt: Prompt) -> dict[str, str]:
     """Ask user for prompt arguments interactively."""
     arguments: dict[str, str] = {}
 
@@ -60,7 +179,7 @@ def get_prompt_arguments(prompt: Prompt) -> dict[str, str]:
 
     for arg in prompt.arguments:
         required_text = "(required)" if arg.required else "(optional)"
-        user_input = input(f"Enter {arg.name} {required_text}: ").strip()
+        user_input = (await ainput(f"Enter {arg.name} {required_text}: ")).strip()
 
         if user_input or arg.required:
             arguments[arg.name] = user_input
@@ -69,49 +188,55 @@ def get_prompt_arguments(prompt: Prompt) -> dict[str, str]:
 
 
 async def search_and_instantiate_resource(
-    client: MultiServerClient, resources: List[Union[Resource, ResourceTemplate]], name: str, is_template: bool = False
+    client: MultiServerClient,
+    resources: Mapping[str, Union[Resource, ResourceTemplate]],
+    name: str,
+    is_template: bool = False,
+    cache: Optional[Dict[str, str]] = None,
 ) -> str:
-    """Retrieve a resource by name from the list of resources.
+    """Retrieve a resource by name from the resource lookup table.
 
     Args:
         client: MultiServerClient instance.
-        resources: List of resource dictionaries.
+        resources: Mapping of resource or resource template names to their definitions.
         name: Name of the resource to retrieve.
+        is_template: Whether the lookup table holds resource templates.
+        cache: Optional cache of resource texts keyed by resolved URI.
 
     Returns:
         The resource content.
 
     """
-    if resources:
-        for resource in resources:
-            if resource.name == name:
-                if not is_template:
-                    uri = resource.uri  # type: ignore[union-attr]
-                else:
-                    uri_template = resource.uriTemplate  # type: ignore[union-attr]
-                    variables = extract_template_variables(uri_template)
-                    print(f"Variables in template: {variables}")
-                    if variables:
-                        var_values = get_template_variables_from_user(uri_template)
-                        uri = substitute_template_variables(uri_template, var_values)
-                    else:
-                        uri = uri_template
-                resource_result = await client.read_resource(uri=uri)
-                # Assuming single text message resource
-                return resource_result.contents[0].text if resource_result.contents else ""  # type: ignore[union-attr]
-    return ""
-
-
-def extract_template_variables(uri_template: str) -> list[str]:
-    """Extract variable names from a URI template."""
-    pattern = r"\{([^}]+)\}"
-    return re.findall(pattern, uri_template)
-
-
-def get_template_variables_from_user(uri_template: str) -> dict[str, str]:
+    resource = resources.get(name)
+    if resource is None:
+        return ""
+    if not is_template:
+        uri = resource.uri  # type: ignore[union-attr]
+    else:
+        uri_template = resource.uriTemplate  # type: ignore[union-attr]
+        variables = extract_template_variables(uri_template)
+        print(f"Variables in template: {variables}")
+        if variables:
+            async with INPUT_LOCK:
+                var_values = await get_template_variables_from_user(uri_template)
+            uri = substitute_template_variables(uri_template, var_values)
+        else:
+            uri = uri_template
+    # Static resources carry an AnyUrl and templates a str; key the cache by the URI text either way
+    key = str(uri)
+    if cache is not None and key in cache:
+        return cache[key]
+    resource_result = await client.read_resource(uri=uri)
+    # Assuming single text message resource
+    text = resource_result.contents[0].text if resource_result.contents else ""  # type: ignore[union-attr]
+    if cache is not None:
+        cache[key] = text
+    return text
+
+
+async def get_template_variables_from_user(uri_template: str) -> dict[str, str]:
     """Extract variables from URI template and ask user for values."""
-    pattern = r"\{([^}]+)\}"
-    variables = re.findall(pattern, uri_template)
+    variables = extract_template_variables(uri_template)
 
     if not variables:
         return {}
@@ -121,23 +246,230 @@ def get_template_variables_from_user(uri_template: str) -> dict[str, str]:
 
     values = {}
     for var in variables:
-        value = input(f"Enter value for {var}: ").strip()
+        value = (await ainput(f"Enter value for {var}: ")).strip()
         values[var] = value
 
     return values
 
 
-def substitute_template_variables(uri_template: str, variables: dict[str, str]) -> str:
-    """Substitute variables in URI template with provided values.
+def estimate_tokens(message: Mapping[str, Any]) -> int:
+    """Roughly estimate the token count of a message at about four characters per token."""
+    chars = len(message.get("content") or "")
+    for tool_call in message.get("tool_calls") or []:
+        chars += len(tool_call["function"]["name"]) + len(tool_call["function"]["arguments"])
+    return chars // 4 + 1
+
 
-    URL-encodes the values to handle spaces and special characters properly.
+def content_words(text: str) -> FrozenSet[str]:
+    """Return the lowercase content words of a text, ignoring short words and stopwords."""
+    return frozenset(word for word in WORD_RE.findall(text.lower()) if len(word) > 2 and word not in STOPWORDS)
+
+
+def select_tool_kwargs(
+    question: str, tool_index: List[Tuple[Dict[str, Any], FrozenSet[str]]], all_tool_kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the tools/tool_choice arguments for a question, sending only tools that look relevant.
+
+    A tool is relevant when its name or description shares at least one content word
+    with the question. If no tool matches, every tool is sent so the model can still
+    pick one.
+
+    Args:
+        question: User question that starts the turn.
+        tool_index: Pairs of (OpenAI tool definition, content words of its name and description).
+        all_tool_kwargs: Prebuilt arguments that include every tool.
+
+    Returns:
+        Request arguments for the completion calls of the turn until the first tool round.
     """
-    result = uri_template
-    for var, value in variables.items():
-        # URL encode the value to handle spaces and special characters
-        encoded_value = quote(value, safe="")
-        result = result.replace(f"{{{var}}}", encoded_value)
-    return result
+    words = content_words(question)
+    selected = [definition for definition, tool_words in tool_index if tool_words & words]
+    if not selected or len(selected) == len(tool_index):
+        return all_tool_kwargs
+    return {"tools": selected, "tool_choice": "auto"}
+
+
+def choose_model(
+    question: str,
+    tool_index: List[Tuple[Dict[str, Any], FrozenSet[str]]],
+    messages: Iterable[Mapping[str, Any]] = (),
+) -> str:
+    """Pick ROUTER_MODEL for short questions that share no content word with any tool, MODEL otherwise.
+
+    Any tool call in the retained history also selects MODEL, so short follow-ups such as
+    "and tomorrow?" keep access to tools.
+    """
+    if len(question) >= ROUTER_MAX_CHARS:
+        return MODEL
+    if any(message.get("tool_calls") for message in messages):
+        return MODEL
+    words = content_words(question)
+    if any(tool_words & words for _, tool_words in tool_index):
+        return MODEL
+    return ROUTER_MODEL
+
+
+def trim_history(
+    messages: Deque[Dict[str, Any]],
+    max_messages: int = MAX_HISTORY_MESSAGES,
+    max_tokens: int = MAX_HISTORY_TOKENS,
+    keep: int = 1,
+) -> None:
+    """Drop the oldest messages in place until the history fits both limits.
+
+    A leading system message and the keep most recent messages are always kept. An assistant
+    message with tool calls is dropped together with its tool replies, so the history
+    never contains tool results without the call that requested them.
+
+    Args:
+        messages: Conversation history to trim.
+        max_messages: Maximum number of messages to keep.
+        max_tokens: Maximum estimated number of tokens to keep.
+        keep: Number of most recent messages that are never dropped, e.g. the current turn.
+    """
+    # Set a leading system message aside so the oldest messages can be popped from the left
+    system = messages.popleft() if messages and messages[0]["role"] == "system" else None
+    if system is not None:
+        max_messages -= 1
+    tokens = sum(estimate_tokens(message) for message in messages)
+
+    while len(messages) > max_messages or tokens > max_tokens:
+        group_size = 1
+        if messages[0].get("tool_calls"):
+            while group_size < len(messages) and messages[group_size]["role"] == "tool":
+                group_size += 1
+        if group_size > len(messages) - keep:
+            break
+        for _ in range(group_size):
+            tokens -= estimate_tokens(messages.popleft())
+
+    if system is not None:
+        messages.appendleft(system)
+
+
+async def stream_completion(
+    openai_client: AsyncOpenAI,
+    messages: Deque[Dict[str, Any]],
+    tool_kwargs: Mapping[str, Any],
+    model: str = MODEL,
+) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Stream a chat completion, printing assistant text as it arrives.
+
+    Args:
+        openai_client: AsyncOpenAI client instance.
+        messages: Conversation history to send.
+        tool_kwargs: Prebuilt tools/tool_choice request arguments, empty when no tools are available.
+        model: Model to call.
+
+    Returns:
+        Tuple of (finish_reason, assistant_message). The assistant message is assembled
+        from the streamed deltas, including any tool calls or refusal, and can be appended
+        to the conversation as is.
+    """
+    stream = await openai_client.chat.completions.create(  # type: ignore[call-overload]
+        model=model,
+        messages=list(messages),
+        stream=True,
+        **tool_kwargs,
+    )
+
+    content_parts: List[str] = []
+    refusal_parts: List[str] = []
+    tool_calls: Dict[int, Dict[str, Any]] = {}
+    finish_reason: Optional[str] = None
+
+    async for chunk in stream:
+        if not chunk.choices:
+            continue
+        choice = chunk.choices[0]
+        delta = choice.delta
+
+        if delta.content:
+            if not content_parts:
+                sys.stdout.write("\n\033[93m")
+            content_parts.append(delta.content)
+            sys.stdout.write(delta.content)
+            sys.stdout.flush()
+
+        if getattr(delta, "refusal", None):
+            refusal_parts.append(delta.refusal)
+
+        # Tool calls arrive as fragments keyed by index; concatenate name and arguments
+        for tool_call_delta in delta.tool_calls or []:
+            tool_call = tool_calls.setdefault(
+                tool_call_delta.index, {"id": "", "type": "function", "function": {"name": "", "arguments": ""}}
+            )
+            if tool_call_delta.id:
+                tool_call["id"] = tool_call_delta.id
+            if tool_call_delta.function:
+                if tool_call_delta.function.name:
+                    tool_call["function"]["name"] += tool_call_delta.function.name
+                if tool_call_delta.function.arguments:
+                    tool_call["function"]["arguments"] += tool_call_delta.function.arguments
+
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+    if content_parts:
+        sys.stdout.write("\033[0m\n\n")
+        sys.stdout.flush()
+
+    message: Dict[str, Any] = {"role": "assistant", "content": "".join(content_parts) or None}
+    if refusal_parts:
+        message["refusal"] = "".join(refusal_parts)
+    if tool_calls:
+        message["tool_calls"] = [tool_calls[index] for index in sorted(tool_calls)]
+    return finish_reason, message
+
+
+async def execute_tool_call(client: MultiServerClient, tool_call: Dict[str, Any]) -> Dict[str, Any]:
+    """Execute a single tool call requested by the LLM.
+
+    Args:
+        client: MultiServerClient instance.
+        tool_call: Tool call entry from the assistant message.
+
+    Returns:
+        The tool message to append to the conversation, containing either the
+        tool result text or an error message.
+    """
+    tool_name = tool_call["function"]["name"]
+    raw_args = tool_call["function"]["arguments"]
+
+    if DEBUG:
+        print(f"\n[Tool Call] {tool_name}")
+    else:
+        print(f"\n[Tool Call] {tool_name} (args_len={len(raw_args)})")
+
+    # Execute tool via appropriate server
+    try:
+        # The MCP session only accepts a dict, so the raw string is parsed exactly once.
+        # Argument-less calls may stream an empty string, which needs no parsing at all.
+        tool_args = json_loads(raw_args) if raw_args.strip() else {}
+        if DEBUG:
+            print(f"[Arguments] {json_dumps_pretty(tool_args)}")
+
+        tool_result = await client.call_tool(tool_name, tool_args)
+
+        # Handle different content types
+        # Extract text content
+        result_text = (
+            tool_result.content[0].text if hasattr(tool_result.content[0], "text") else str(tool_result.content[0])
+        )
+
+        print(f"[Result] {result_text}\n")
+        content = result_text
+
+    except Exception as e:
+        content = f"Error executing tool {tool_name}: {str(e)}"
+        print(f"[Error] {content}\n")
+
+    # Tool response for the conversation
+    return {
+        "role": "tool",
+        "tool_call_id": tool_call["id"],
+        "content": content,
+    }
 
 
 async def chat(config_path: str = "examples/mcp_servers.json") -> None:
@@ -146,6 +478,7 @@ async def chat(config_path: str = "examples/mcp_servers.json") -> None:
     Args:
         config_path: Path to the server configuration file.
     """
+    assert os.getenv("OPENAI_API_KEY"), "Error: OPENAI_API_KEY not found in environment"
 
     try:
         async with AsyncExitStack() as stack:
@@ -161,149 +494,125 @@ async def chat(config_path: str = "examples/mcp_servers.json") -> None:
             all_resources = client.list_resources().resources
             all_resource_templates = client.list_resource_templates().resourceTemplates
 
+            # Index them by name once so +prompt/+resource/+template lookups are O(1)
+            prompts_by_name = {prompt.name: prompt for prompt in all_prompts}
+            resources_by_name = {resource.name: resource for resource in all_resources}
+            templates_by_name = {template.name: template for template in all_resource_templates}
+            directive_names = {"prompt": prompts_by_name, "resource": resources_by_name, "template": templates_by_name}
+
+            # Session caches for content that was already fetched with the same name/arguments or URI
+            prompt_cache: Optional[Dict[Tuple[str, FrozenSet[Tuple[str, str]]], str]] = {} if CACHE_ENABLED else None
+            resource_cache: Optional[Dict[str, str]] = {} if CACHE_ENABLED else None
+
             # Get all tools for OpenAI using the new list_tools() method
             tools_result = client.list_tools()
             all_tools: List[Tool] = tools_result.tools or []
 
-            # Convert MCP tools to OpenAI format
-            openai_tools = [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool.name,
-                        "description": tool.description,
-                        "parameters": tool.inputSchema,
-                    },
-                }
-                for tool in all_tools
+            # Convert MCP tools to OpenAI format and build the tool arguments once for every LLM call
+            openai_tools = mcp_tools_to_openai_format(all_tools)
+            tool_kwargs: Dict[str, Any] = {"tools": openai_tools, "tool_choice": "auto"} if openai_tools else {}
+            tool_index = [
+                (definition, content_words(f"{tool.name} {tool.description or ''}"))
+                for definition, tool in zip(openai_tools, all_tools)
             ]
 
-            # Initialize OpenAI client
-            openai_client = OpenAI()
+            # Initialize async OpenAI client so LLM calls don't block the event loop. One pooled
+            # (HTTP/2 when available) connection is reused across every completion of the session.
+            http_client = await stack.enter_async_context(
+                httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(60.0, connect=5.0),
+                )
+            )
+            openai_client = await stack.enter_async_context(
+                AsyncOpenAI(http_client=http_client, max_retries=MAX_RETRIES)
+            )
 
             # Chat loop
-            messages: List[Dict[str, Any]] = []
+            messages: Deque[Dict[str, Any]] = deque()
+            # Directive contents added since the last question; trimming never drops them
+            pending_context = 0
             print("Multi-Server MCP Chat Client")
             print("Type 'exit' or 'quit' to end the conversation\n")
 
-            query = input("> ")
+            query = await ainput("> ")
 
             while query.lower() not in ("exit", "quit"):
 
-                # Add user message, prompt or resource
-                if query.startswith("+prompt:"):
-                    prompt = await search_and_instantiate_prompt(client, all_prompts, query[len("+prompt:") :].strip())
-                    if not prompt:
-                        print(f"Prompt '{query[len('+prompt:') :].strip()}' not found.")
+                # Resolve leading +prompt:/+resource:/+template: directives concurrently
+                directives, question = parse_directives(query, directive_names)
+                fetches = []
+                for kind, name in directives:
+                    if kind == "prompt":
+                        fetches.append(
+                            search_and_instantiate_prompt(client, prompts_by_name, name, cache=prompt_cache)
+                        )
+                    elif kind == "resource":
+                        fetches.append(
+                            search_and_instantiate_resource(client, resources_by_name, name, cache=resource_cache)
+                        )
                     else:
+                        fetches.append(
+                            search_and_instantiate_resource(
+                                client, templates_by_name, name, is_template=True, cache=resource_cache
+                            )
+                        )
+                contents = await asyncio.gather(*fetches)
 
-                        print(f"****Retrieved prompt content:\n{prompt}\n")
-
-                        messages.append({"role": "user", "content": prompt})
-                    query = input("> ")
-                    continue
-
-                if query.startswith("+resource:"):
-                    resource_name = query[len("+resource:") :].strip()
-                    # List variance: List[Resource] not compatible with List[Union[Resource, ResourceTemplate]]
-                    resource = await search_and_instantiate_resource(
-                        client, all_resources, resource_name  # type: ignore[arg-type]
-                    )
-                    if not resource:
-                        print(f"Resource '{resource_name}' not found.")
+                for (kind, name), content in zip(directives, contents):
+                    label, heading = DIRECTIVE_LABELS[kind]
+                    if not content:
+                        print(f"{label} '{name}' not found.")
                     else:
+                        if DEBUG:
+                            print(f"****{heading}:\n{content}\n")
+                        else:
+                            print(f"****{heading}: {name} ({len(content)} chars)")
 
-                        print(f"****Retrieved resource content:\n{resource}\n")
+                        messages.append({"role": "user", "content": content})
+                        pending_context += 1
 
-                        messages.append({"role": "user", "content": resource})
-                    query = input("> ")
+                # A line made only of directives just adds context; wait for the actual question
+                if not question:
+                    query = await ainput("> ")
                     continue
 
-                if query.startswith("+template:"):
-                    template_name = query[len("+template:") :].strip()
-                    # List variance: List[ResourceTemplate] not compatible with List[Union[...]]
-                    resource = await search_and_instantiate_resource(
-                        client, all_resource_templates, template_name, is_template=True  # type: ignore[arg-type]
+                messages.append({"role": "user", "content": question})
+                trim_history(messages, keep=pending_context + 1)
+                pending_context = 0
+
+                # Short tool-free turns of a conversation without tool use go to the cheaper model without
+                # tools. Otherwise send only the tools relevant to the question.
+                model = choose_model(question, tool_index, messages)
+                turn_tool_kwargs: Dict[str, Any] = (
+                    {} if model == ROUTER_MODEL else select_tool_kwargs(question, tool_index, tool_kwargs)
+                )
+
+                # Call the LLM until it answers without tool calls; text is printed as it streams in
+                while True:
+                    finish_reason, assistant_message = await stream_completion(
+                        openai_client, messages, turn_tool_kwargs, model=model
                     )
-                    if not resource:
-                        print(f"Resource Template '{template_name}' not found.")
-                    else:
-
-                        print(f"****Instantiated template content:\n{resource}\n")
-
-                        messages.append({"role": "user", "content": resource})
-                    query = input("> ")
-                    continue
-
-                messages.append({"role": "user", "content": query})
-
-                # Make OpenAI LLM call to answer the user query
-                response = openai_client.chat.completions.create(  # type: ignore[call-overload]
-                    model=MODEL,
-                    messages=messages,
-                    tools=openai_tools if openai_tools else None,
-                    tool_choice="auto" if openai_tools else None,
-                ).choices[0]
-
-                # Handle tool calls
-                while response.finish_reason == "tool_calls":
-                    messages.append(response.message)
-
-                    for tool_call in response.message.tool_calls:
-                        tool_name = tool_call.function.name
-                        tool_args = json.loads(tool_call.function.arguments)
-
-                        print(f"\n[Tool Call] {tool_name}")
-                        print(f"[Arguments] {json.dumps(tool_args, indent=2)}")
-
-                        # Execute tool via appropriate server
-                        try:
-                            tool_result = await client.call_tool(tool_name, tool_args)
-
-                            # Handle different content types
-                            # Extract text content
-                            result_text = (
-                                tool_result.content[0].text
-                                if hasattr(tool_result.content[0], "text")
-                                else str(tool_result.content[0])
-                            )
-
-                            print(f"[Result] {result_text}\n")
-
-                            # Add tool response to conversation
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": result_text,
-                                }
-                            )
-
-                        except Exception as e:
-                            error_msg = f"Error executing tool {tool_name}: {str(e)}"
-                            print(f"[Error] {error_msg}\n")
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": error_msg,
-                                }
-                            )
-
-                    # Get next response from LLM with tool results
-                    response = openai_client.chat.completions.create(  # type: ignore[call-overload]
-                        model=MODEL,
-                        messages=messages,
-                        tools=openai_tools if openai_tools else None,
-                        tool_choice="auto" if openai_tools else None,
-                    ).choices[0]
-
-                # Print assistant response
-                print(f"\n\033[93m{response.message.content}\033[0m\n")
-                messages.append(response.message)
+                    if model == ROUTER_MODEL and assistant_message.get("refusal"):
+                        # The cheaper model declined; retry the turn with the full model and its tools
+                        model = MODEL
+                        turn_tool_kwargs = select_tool_kwargs(question, tool_index, tool_kwargs)
+                        continue
+                    messages.append(assistant_message)
+                    if finish_reason != "tool_calls":
+                        break
+
+                    # Independent tool calls of one turn run concurrently; results keep call order
+                    tool_messages = await asyncio.gather(
+                        *(execute_tool_call(client, tool_call) for tool_call in assistant_message["tool_calls"])
+                    )
+                    messages.extend(tool_messages)
+                    # Chained calls may need tools the question didn't mention; offer every tool from now on
+                    turn_tool_kwargs = tool_kwargs
 
                 # Get next user input
-                query = input("> ")
+                query = await ainput("> ")
 
     except FileNotFoundError as e:
         print(f"Configuration error: {e}")
@@ -313,4 +622,17 @@ async def chat(config_path: str = "examples/mcp_servers.json") -> None:
 
 
 if __name__ == "__main__":
+    # The library only logs through a NullHandler; show its connection progress here
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)-8s %(message)-60s %(filename)s:%(lineno)d",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        # libuv-backed loop with lower scheduling and I/O overhead than the default asyncio loop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(chat())
@@ -1,20 +1,25 @@
 import asyncio
-import re
+import sys
 import traceback
-from urllib.parse import quote
 
 from pydantic import AnyUrl
 
-from mcp import (
-    ClientSession,
-    StdioServerParameters,
-)
-from mcp.client.stdio import stdio_client
+from mcp import StdioServerParameters
 from mcp.types import (
     BlobResourceContents,
     ReadResourceResult,
     TextResourceContents,
 )
+from mcp_multi_server.utils import (
+    extract_template_variables,
+    substitute_template_variables,
+)
+
+
+try:
+    from ..support.mcp_session import mcp_session
+except ImportError:
+    from examples.support.mcp_session import mcp_session
 
 
 server_params = StdioServerParameters(
@@ -25,32 +30,29 @@ server_params = StdioServerParameters(
 
 def print_resource_result(resources: ReadResourceResult) -> None:
     """Print the content of a Resource URI"""
+    # Buffer the whole output and write it once instead of one print() per line
+    buf: list[str] = []
     for i, resource in enumerate(resources.contents):
-        print(f"Content {i} ({type(resource)}):")
+        resource_type = type(resource)
+        buf.append(f"Content {i} ({resource_type}):\n")
 
         if isinstance(resource, TextResourceContents):
-            print(f"  {resource.text}")
+            buf.append(f"  {resource.text}\n")
         elif isinstance(resource, BlobResourceContents):
-            print(f"- MIME type: {resource.mimeType}")
+            buf.append(f"- MIME type: {resource.mimeType}\n")
             if len(resource.blob) > 50:
-                print(f"- Blob data (first 50 bytes): {resource.blob[:50]!r}...")
+                buf.append(f"- Blob data (first 50 bytes): {resource.blob[:50]!r}...\n")
             else:
-                print(f"- Blob data: {resource.blob!r}")
+                buf.append(f"- Blob data: {resource.blob!r}\n")
         else:
-            print(f"  Unknown content type: {type(resource)}")
-        print()
-
-
-def extract_template_variables(uri_template: str) -> list[str]:
-    """Extract variable names from a URI template."""
-    pattern = r"\{([^}]+)\}"
-    return re.findall(pattern, uri_template)
+            buf.append(f"  Unknown content type: {resource_type}\n")
+        buf.append("\n")
+    sys.stdout.write("".join(buf))
 
 
 def get_template_variables_from_user(uri_template: str) -> dict[str, str]:
     """Extract variables from URI template and ask user for values."""
-    pattern = r"\{([^}]+)\}"
-    variables = re.findall(pattern, uri_template)
+    variables = extract_template_variables(uri_template)
 
     if not variables:
         return {}
@@ -66,58 +68,53 @@ def get_template_variables_from_user(uri_template: str) -> dict[str, str]:
     return values
 
 
-def substitute_template_variables(uri_template: str, variables: dict[str, str]) -> str:
-    """Substitute variables in URI template with provided values.
-
-    URL-encodes the values to handle spaces and special characters properly.
-    """
-    result = uri_template
-    for var, value in variables.items():
-        # URL encode the value to handle spaces and special characters
-        encoded_value = quote(value, safe="")
-        result = result.replace(f"{{{var}}}", encoded_value)
-    return result
-
-
 async def run() -> None:
     try:
         print("Starting resource_client...")
-        async with stdio_client(server_params) as (read, write):
-            print("Client connected, creating session...")
-            async with ClientSession(read, write) as session:
-
-                print("Initializing session...")
-                await session.initialize()
-
-                resources = await session.list_resources()
-                print(f"\nFound {len(resources.resources)} resources:")
-                for i, resource in enumerate(resources.resources):
-                    print(f"Resource[{i}] attributes:")
-                    print(f"- Name: {resource.name}")
-                    print(f"- Description: {resource.description}")
-                    print(f"- URI: {resource.uri}")
-                    result = await session.read_resource(uri=AnyUrl(resource.uri))
-                    print_resource_result(result)
-                    print("-" * 20)
-
-                templates = await session.list_resource_templates()
-                print(f"\nFound {len(templates.resourceTemplates)} resource templates:")
-                for i, template in enumerate(templates.resourceTemplates):
-                    print(f"Template[{i}] attributes:")
-                    print(f"- Name: {template.name}")
-                    print(f"- Description: {template.description}")
-                    print(f"- URI Template: {template.uriTemplate}")
-                    variables = extract_template_variables(template.uriTemplate)
-                    print(f"Variables in template: {variables}")
-                    if variables:
-                        var_values = get_template_variables_from_user(template.uriTemplate)
-                        uri = substitute_template_variables(template.uriTemplate, var_values)
-                    else:
-                        uri = template.uriTemplate
-
+        # The server is spawned once and the session is reused for every read below
+        async with mcp_session(server_params) as session:
+            print("Client connected and session initialized")
+
+            resources = await session.list_resources()
+            print(f"\nFound {len(resources.resources)} resources:")
+            # Requests are multiplexed over the same session, so read all resources concurrently
+            results = await asyncio.gather(
+                *(session.read_resource(uri=AnyUrl(resource.uri)) for resource in resources.resources)
+            )
+            for i, (resource, result) in enumerate(zip(resources.resources, results)):
+                print(f"Resource[{i}] attributes:")
+                print(f"- Name: {resource.name}")
+                print(f"- Description: {resource.description}")
+                print(f"- URI: {resource.uri}")
+                print_resource_result(result)
+                print("-" * 20)
+
+            templates = await session.list_resource_templates()
+            print(f"\nFound {len(templates.resourceTemplates)} resource templates:")
+            # Templates without variables need no user input, so prefetch them concurrently
+            static_templates = [
+                t for t in templates.resourceTemplates if not extract_template_variables(t.uriTemplate)
+            ]
+            static_results = await asyncio.gather(
+                *(session.read_resource(uri=AnyUrl(t.uriTemplate)) for t in static_templates)
+            )
+            prefetched = dict(zip((t.uriTemplate for t in static_templates), static_results))
+            for i, template in enumerate(templates.resourceTemplates):
+                print(f"Template[{i}] attributes:")
+                print(f"- Name: {template.name}")
+                print(f"- Description: {template.description}")
+                print(f"- URI Template: {template.uriTemplate}")
+                variables = extract_template_variables(template.uriTemplate)
+                print(f"Variables in template: {variables}")
+                if variables:
+                    var_values = get_template_variables_from_user(template.uriTemplate)
+                    uri = substitute_template_variables(template.uriTemplate, var_values)
                     result = await session.read_resource(uri=AnyUrl(uri))
-                    print_resource_result(result)
-                    print("-" * 20)
+                else:
+                    result = prefetched[template.uriTemplate]
+
+                print_resource_result(result)
+                print("-" * 20)
 
     except Exception:
         print("An error occurred:")
@@ -125,4 +122,7 @@ async def run() -> None:
 
 
 if __name__ == "__main__":
+    if sys.platform == "win32":
+        # The selector loop avoids the Proactor loop's idle CPU overhead on stdio pipes
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore[attr-defined]
     asyncio.run(run())
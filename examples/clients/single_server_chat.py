@@ -1,21 +1,39 @@
 import asyncio
 import json
 import os
+import sys
 import traceback
+from typing import (
+    Any,
+    Callable,
+    Union,
+)
 
 from dotenv import (
     find_dotenv,
     load_dotenv,
 )
-from mcp import (
-    ClientSession,
-    StdioServerParameters,
-)
-from mcp.client.stdio import stdio_client
+from mcp import StdioServerParameters
 from mcp.types import ListToolsResult
+from mcp_multi_server.utils import mcp_tools_to_openai_format
 from openai import OpenAI
 
 
+try:
+    from ..support.mcp_session import mcp_session
+except ImportError:
+    from examples.support.mcp_session import mcp_session
+
+
+json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+
 load_dotenv(find_dotenv())
 assert os.getenv("OPENAI_API_KEY"), "OPENAI_API_KEY not found"
 
@@ -48,34 +66,52 @@ async def chat() -> None:
     try:
         print("****Connecting to tool server using:")
         print_server_params(server_params)
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-
-                tools_result = await session.list_tools()
-                print("***Listing tools...")
-                print_tools(tools_result)
-
-                client = OpenAI()
-
-                openai_tools = [
-                    {
-                        "type": "function",
-                        "function": {
-                            "name": tool.name,
-                            "description": tool.description,
-                            "parameters": tool.inputSchema,
-                        },
-                    }
-                    for tool in tools_result.tools
-                ]
-
-                messages = []
-                query = input(">")
-
-                while query.lower() not in ("exit", "quit"):
-                    # Make OpenAI LLM call to answer the user query
-                    messages.append({"role": "user", "content": query})
+        # One subprocess and session for the whole REPL; every tool call reuses it
+        async with mcp_session(server_params) as session:
+            tools_result = await session.list_tools()
+            print("***Listing tools...")
+            print_tools(tools_result)
+
+            client = OpenAI()
+
+            openai_tools = mcp_tools_to_openai_format(tools_result.tools)
+
+            messages = []
+            query = input(">")
+
+            while query.lower() not in ("exit", "quit"):
+                # Make OpenAI LLM call to answer the user query
+                messages.append({"role": "user", "content": query})
+                response = client.chat.completions.create(  # type: ignore[call-overload]
+                    model=MODEL,
+                    messages=messages,
+                    tools=openai_tools,
+                    tool_choice="auto",
+                ).choices[0]
+
+                # Handle any tool calls
+                while response.finish_reason == "tool_calls":
+                    messages.append(response.message)
+                    for tool_call in response.message.tool_calls:
+                        # Execute tool call
+                        print(
+                            f"****Calling tool: {tool_call.function.name}, with arguments: {tool_call.function.arguments}"
+                        )
+                        tool_result = await session.call_tool(
+                            name=tool_call.function.name,
+                            arguments=json_loads(tool_call.function.arguments),
+                        )
+                        # Add tool response to conversation
+                        messages.append(
+                            {
+                                "role": "tool",
+                                "tool_call_id": tool_call.id,
+                                "content": tool_result.content[0].text,  # type: ignore[union-attr]
+                            }
+                        )
+                        print(f"****Tool result: {tool_result.content[0].text}")  # type: ignore[union-attr]
+
+                    # Get another response from LLM including tool results
                     response = client.chat.completions.create(  # type: ignore[call-overload]
                         model=MODEL,
                         messages=messages,
@@ -83,39 +119,9 @@ async def chat() -> None:
                         tool_choice="auto",
                     ).choices[0]
 
-                    # Handle any tool calls
-                    while response.finish_reason == "tool_calls":
-                        messages.append(response.message)
-                        for tool_call in response.message.tool_calls:
-                            # Execute tool call
-                            print(
-                                f"****Calling tool: {tool_call.function.name}, with arguments: {tool_call.function.arguments}"
-                            )
-                            tool_result = await session.call_tool(
-                                name=tool_call.function.name,
-                                arguments=json.loads(tool_call.function.arguments),
-                            )
-                            # Add tool response to conversation
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.id,
-                                    "content": tool_result.content[0].text,  # type: ignore[union-attr]
-                                }
-                            )
-                            print(f"****Tool result: {tool_result.content[0].text}")  # type: ignore[union-attr]
-
-                        # Get another response from LLM including tool results
-                        response = client.chat.completions.create(  # type: ignore[call-overload]
-                            model=MODEL,
-                            messages=messages,
-                            tools=openai_tools,
-                            tool_choice="auto",
-                        ).choices[0]
-
-                    print(f"\033[93m{response.message.content}\033[0m")
-                    messages.append(response.message)
-                    query = input(">")
+                print(f"\033[93m{response.message.content}\033[0m")
+                messages.append(response.message)
+                query = input(">")
 
     except Exception:
         print("An error occurred:")
@@ -123,4 +129,7 @@ async def chat() -> None:
 
 
 if __name__ == "__main__":
+    if sys.platform == "win32":
+        # The selector loop avoids the Proactor loop's idle CPU overhead on stdio pipes
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())  # type: ignore[attr-defined]
     asyncio.run(chat())
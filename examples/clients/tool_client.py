@@ -1,7 +1,12 @@
 import asyncio
 import json
 import traceback
-from typing import Any
+from typing import (
+    Any,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 from mcp import (
     ClientSession,
@@ -51,7 +56,42 @@ def print_tools(tools: ListToolsResult) -> None:
         print("-" * 20)
 
 
-def get_tool_arguments(tool: Tool) -> dict[str, Any]:  # pylint: disable=too-many-locals
+class SchemaField(NamedTuple):
+    """A tool argument resolved from an input schema."""
+
+    name: str
+    description: str
+    type: str
+    required: bool
+    fields: Optional[Tuple["SchemaField", ...]] = None  # properties of a $ref object, None for simple values
+
+
+def compile_input_schema(schema: dict) -> Tuple[SchemaField, ...]:
+    """Resolve an input schema into argument fields, following $ref objects one level deep."""
+    definitions = schema.get("$defs", {})
+
+    def compile_properties(properties: dict, required: list, resolve_refs: bool) -> Tuple[SchemaField, ...]:
+        fields = []
+        for prop, prop_schema in properties.items():
+            nested = None
+            if resolve_refs and "$ref" in prop_schema:
+                definition = definitions.get(prop_schema["$ref"].split("/")[-1], {})  # name from "#/$defs/Person"
+                nested = compile_properties(definition.get("properties", {}), definition.get("required", []), False)
+            fields.append(
+                SchemaField(
+                    prop,
+                    prop_schema.get("description", ""),
+                    prop_schema.get("type", "string"),
+                    prop in required,
+                    nested,
+                )
+            )
+        return tuple(fields)
+
+    return compile_properties(schema.get("properties", {}), schema.get("required", []), True)
+
+
+def get_tool_arguments(tool: Tool) -> dict[str, Any]:
     """Ask user for tool arguments interactively."""
     arguments: dict[str, Any] = {}
 
@@ -61,20 +101,6 @@ def get_tool_arguments(tool: Tool) -> dict[str, Any]:  # pylint: disable=too-man
     print(f"\nEntering arguments for tool '{tool.name}':")
     print(f"Description: {tool.description}")
 
-    properties = tool.inputSchema.get("properties", {})
-    required_props = tool.inputSchema.get("required", [])
-    definitions = tool.inputSchema.get("$defs", {})
-
-    def get_object_properties(schema_ref: str) -> dict:
-        """Get properties from a $ref definition."""
-        ref_name = schema_ref.split("/")[-1]  # Extract name from "#/$defs/Person"
-        return definitions.get(ref_name, {}).get("properties", {})
-
-    def get_object_required(schema_ref: str) -> list:
-        """Get required fields from a $ref definition."""
-        ref_name = schema_ref.split("/")[-1]
-        return definitions.get(ref_name, {}).get("required", [])
-
     def convert_value(value: str, value_type: str) -> Any:
         """Convert string input to appropriate type."""
         if value_type == "integer":
@@ -113,33 +139,24 @@ def get_tool_arguments(tool: Tool) -> dict[str, Any]:  # pylint: disable=too-man
                 print(f"{indent}Error: Invalid {prop_type} value. Please try again.")
 
     # get the tool argument using the tool's input schema
-    for prop, schema in properties.items():
-        description = schema.get("description", "")
-        prop_type = schema.get("type", "string")
-        is_required = prop in required_props
-
+    for field in compile_input_schema(tool.inputSchema):
         # Handle $ref (object references)
-        if "$ref" in schema:
-            print(f"\n--- Entering object '{prop}' ---")
-            obj_properties = get_object_properties(schema["$ref"])
-            obj_required = get_object_required(schema["$ref"])
-
+        if field.fields is not None:
+            print(f"\n--- Entering object '{field.name}' ---")
             obj_data = {}
-            for obj_prop, obj_schema in obj_properties.items():
-                obj_description = obj_schema.get("description", "")
-                obj_type = obj_schema.get("type", "string")
-                obj_is_required = obj_prop in obj_required
-
-                result = get_property_input(obj_prop, obj_description, obj_type, obj_is_required, "  ")
+            for obj_field in field.fields:
+                result = get_property_input(
+                    obj_field.name, obj_field.description, obj_field.type, obj_field.required, "  "
+                )
                 if result is not None:
-                    obj_data[obj_prop] = result
+                    obj_data[obj_field.name] = result
 
-            arguments[prop] = obj_data
+            arguments[field.name] = obj_data
         else:
             # Handle simple properties
-            result = get_property_input(prop, description, prop_type, is_required)
+            result = get_property_input(field.name, field.description, field.type, field.required)
             if result is not None:
-                arguments[prop] = result
+                arguments[field.name] = result
 
     return arguments
 
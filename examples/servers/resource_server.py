@@ -1,4 +1,9 @@
-from typing import List
+from functools import lru_cache
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
 from urllib.parse import unquote
 from uuid import UUID
 
@@ -29,13 +34,30 @@ except ImportError:
 
 mcp = FastMCP("Inventory Management")
 
+# Category lookup by value, so unknown categories are rejected without raising
+_CATEGORIES = {category.value: category for category in ItemCategory}
+_INVALID_CATEGORY_MESSAGE = f"Invalid category. Valid categories: {', '.join(_CATEGORIES)}"
+
+# (database version, rendered text) of the last inventory://templates response
+_templates_cache: Optional[Tuple[int, str]] = None
+
+
+@lru_cache(maxsize=1024)
+def _parse_uuid(value: str) -> Optional[UUID]:
+    """Parse a UUID string, returning None instead of raising for invalid input."""
+    try:
+        return UUID(value)
+    except ValueError:
+        return None
+
 
 @mcp.resource("inventory://overview")
 def get_inventory_overview() -> InventoryOverview:
     """Returns comprehensive inventory overview."""
-    total_items = len(db.list_enriched_items())
+    # Counts come from the database indexes, so no item is enriched just to be counted
+    total_items = db.count_items()
     total_value = db.get_inventory_value()
-    low_stock_items = len(db.get_low_stock_items())
+    low_stock_items = db.count_low_stock_items()
     category_stats = db.get_category_stats()
 
     return InventoryOverview(
@@ -59,17 +81,16 @@ def get_item_details(item_id: str) -> EnrichedInventoryItem | str:
     Parameter: item_id (UUID string) - Use UUIDs from inventory://items resource.
     Example: inventory://item/e6ec9f9f-19a3-49bd-8efe-97aca565afb0
     Returns: Complete item details including product info, pricing, stock levels, and supplier data."""
-    try:
-        uuid_id = UUID(item_id)
-        item = db.get_enriched_item(uuid_id)
+    uuid_id = _parse_uuid(item_id)
+    if uuid_id is None:
+        return f"Invalid item ID format: {item_id}"
 
-        if not item:
-            return f"Item with ID {item_id} not found."
+    item = db.get_enriched_item(uuid_id)
 
-        return item
+    if not item:
+        return f"Item with ID {item_id} not found."
 
-    except ValueError:
-        return f"Invalid item ID format: {item_id}"
+    return item
 
 
 @mcp.resource("inventory://item/name/{item_name}")
@@ -106,18 +127,16 @@ def get_items_by_category(category: str) -> List[EnrichedInventoryItem] | str:
 
     Examples: inventory://category/beverages, inventory://category/electronics
     Returns: List of all items in the specified category."""
-    try:
-        cat_enum = ItemCategory(category.lower())
-        items = db.list_enriched_items(category=cat_enum)
+    cat_enum = _CATEGORIES.get(category.lower())
+    if cat_enum is None:
+        return _INVALID_CATEGORY_MESSAGE
 
-        if not items:
-            return f"No items found in category '{category.title()}'."
+    items = db.list_enriched_items(category=cat_enum)
 
-        return items
+    if not items:
+        return f"No items found in category '{category.title()}'."
 
-    except ValueError:
-        valid_categories = [cat.value for cat in ItemCategory]
-        return f"Invalid category. Valid categories: {', '.join(valid_categories)}"
+    return items
 
 
 @mcp.resource("inventory://low-stock")
@@ -159,7 +178,12 @@ def search_inventory(query: str) -> List[EnrichedInventoryItem] | str:
 @mcp.resource("inventory://database-schema")
 def get_inventory_database_schema() -> DatabaseSchema:
     """Returns the complete database schema definition."""
+    return _database_schema()
+
 
+@lru_cache(maxsize=1)
+def _database_schema() -> DatabaseSchema:
+    """Build the constant schema definition once and reuse it for every request."""
     # Define all entities with their field types
     entities = {
         "Supplier": {
@@ -284,15 +308,14 @@ def get_inventory_database_schema() -> DatabaseSchema:
 @mcp.resource("inventory://stats")
 def get_inventory_statistics() -> InventoryStatistics:
     """Returns comprehensive inventory statistics."""
-    total_items = len(db.list_enriched_items())
+    total_items = db.count_items()
     total_value = db.get_inventory_value()
     category_stats = db.get_category_stats()
-    low_stock_count = len(db.get_low_stock_items())
+    low_stock_count = db.count_low_stock_items()
 
     # Calculate additional stats
-    active_items = len(db.list_enriched_items(status=ItemStatus.ACTIVE))
-    all_items = db.list_enriched_items()
-    out_of_stock = len([item for item in all_items if item.quantity_on_hand == 0])
+    active_items = db.count_items(status=ItemStatus.ACTIVE)
+    out_of_stock = db.count_out_of_stock_items()
 
     # Calculate category percentages
     category_percentages = {
@@ -347,19 +370,19 @@ def get_inventory_price_from_inventory_id(inventory_id: str) -> str:
 
     Returns: Current selling price as decimal string (e.g., '12.99').
     For cost analysis, use full item details from inventory://item/{item_id}."""
-    try:
-        uuid_id = UUID(inventory_id)
+    uuid_id = _parse_uuid(inventory_id)
+    if uuid_id is not None:
         item = db.get_enriched_item(uuid_id)
         if item:
             return str(item.price)
         return f"Item with ID {inventory_id} not found"
-    except ValueError:
-        # Try to find by name for backward compatibility (URL decode for spaces)
-        decoded_name = unquote(inventory_id)
-        item = db.get_enriched_item_by_name(decoded_name)
-        if item:
-            return str(item.price)
-        return f"Invalid ID format or item not found: {decoded_name}"
+
+    # Try to find by name for backward compatibility (URL decode for spaces)
+    decoded_name = unquote(inventory_id)
+    item = db.get_enriched_item_by_name(decoded_name)
+    if item:
+        return str(item.price)
+    return f"Invalid ID format or item not found: {decoded_name}"
 
 
 @mcp.resource("inventory://templates")
@@ -369,8 +392,19 @@ def get_available_templates() -> str:
     This resource helps Claude understand what templates are available and shows
     current valid values that can be used in the templates.
     """
-    # Get current items for examples
-    items = db.list_enriched_items()
+    global _templates_cache
+
+    # Re-render only after the database has changed
+    version = db.version
+    if _templates_cache is None or _templates_cache[0] != version:
+        _templates_cache = (version, _render_available_templates())
+    return _templates_cache[1]
+
+
+def _render_available_templates() -> str:
+    """Render the inventory://templates text for the current database contents."""
+    # Get current items for examples; only the first five by name are shown
+    items = db.list_enriched_items(limit=5)
     if not items:
         return "No inventory items available"
 
@@ -409,8 +443,8 @@ AVAILABLE RESOURCE TEMPLATES:
    Example: inventory://{sample_id}/price
 
 CURRENT AVAILABLE ITEMS:
-{chr(10).join(f'- {item.name} (ID: {item.id})' for item in items[:5])}
-{'...' if len(items) > 5 else ''}
+{chr(10).join(f'- {item.name} (ID: {item.id})' for item in items)}
+{'...' if db.count_items() > 5 else ''}
 
 To use templates, replace {{parameter}} with actual values from the examples above.
 """
@@ -1,11 +1,11 @@
 """Example showing structured input and output with tools."""
 
 import logging
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, Optional, Tuple, TypedDict
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import AudioContent, CallToolResult, ImageContent
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 try:
     from ..support.media_handler import get_audio, get_image
@@ -33,31 +33,68 @@ class LocationInfo(TypedDict):
 
 
 class MemberDatabase(BaseModel):
+    # Change members through the methods below so the name index stays in sync
     members: dict[str, Person] = Field(default_factory=dict, description="In-memory database of members")
     next_id: int = Field(default=1, description="Next sequential ID to assign")
+    # (first_name, last_name) -> IDs of the members with that name, in members order
+    _name_index: Dict[Tuple[str, str], List[str]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: object) -> None:
+        """Index members passed to the constructor."""
+        for member_id, person in self.members.items():  # pylint: disable=no-member
+            self._name_index.setdefault((person.first_name, person.last_name), []).append(member_id)
+
+    def _index_member(self, member_id: str, person: Person) -> None:
+        """Record a member that is already in members in the name index."""
+        name = (person.first_name, person.last_name)
+        member_ids = self._name_index.setdefault(name, [])
+        if member_ids and next(reversed(self.members)) != member_id:  # pylint: disable=no-member
+            # A replaced ID keeps its earlier position in members; rebuild this name's IDs in that order
+            member_ids[:] = [
+                other_id
+                for other_id, other in self.members.items()  # pylint: disable=no-member
+                if (other.first_name, other.last_name) == name
+            ]
+        else:
+            member_ids.append(member_id)
+
+    def _unindex_member(self, member_id: str, person: Person) -> None:
+        """Drop a member from the name index."""
+        name = (person.first_name, person.last_name)
+        member_ids = self._name_index.get(name)
+        if member_ids and member_id in member_ids:
+            member_ids.remove(member_id)
+            if not member_ids:
+                del self._name_index[name]
 
     def add_member(self, person: Person) -> str:
         """Add a person to the database with auto-generated sequential ID."""
         member_id = str(self.next_id)
-        self.members[member_id] = person
+        self._set_member(member_id, person)
         self.next_id += 1
         return member_id
 
     def add_member_with_id(self, member_id: str, person: Person) -> str:
         """Add a person to the database with specific ID (legacy method)."""
-        self.members[member_id] = person
+        self._set_member(member_id, person)
         return f"Added member {member_id} to database"
 
+    def _set_member(self, member_id: str, person: Person) -> None:
+        """Store a person under an ID, replacing any previous member and updating the name index."""
+        previous = self.members.get(member_id)  # pylint: disable=no-member
+        self.members[member_id] = person
+        if previous is not None:
+            self._unindex_member(member_id, previous)
+        self._index_member(member_id, person)
+
     def get_member(self, member_id: str) -> Person | None:
         """Retrieve a person from the database."""
         return self.members.get(member_id)  # pylint: disable=no-member
 
     def get_member_id(self, first_name: str, last_name: str) -> Optional[str]:
         """Get member ID by first and last name."""
-        for member_id, person in self.members.items():  # pylint: disable=no-member
-            if person.first_name == first_name and person.last_name == last_name:
-                return member_id
-        return None
+        member_ids = self._name_index.get((first_name, last_name))
+        return member_ids[0] if member_ids else None
 
     def list_members(self) -> list[str]:
         """List all member IDs in the database."""
@@ -66,7 +103,8 @@ class MemberDatabase(BaseModel):
     def remove_member(self, member_id: str) -> str:
         """Remove a person from the database."""
         if member_id in self.members:
-            del self.members[member_id]
+            person = self.members.pop(member_id)  # pylint: disable=no-member
+            self._unindex_member(member_id, person)
             return f"Removed member {member_id} from database"
         return f"Member {member_id} not found"
 
@@ -1,10 +1,20 @@
+from dataclasses import (
+    asdict,
+    dataclass,
+)
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from heapq import nsmallest
+from operator import attrgetter
 from typing import (
+    Any,
     Dict,
+    Iterable,
+    Iterator,
     List,
     Optional,
+    Set,
 )
 from uuid import (
     UUID,
@@ -14,10 +24,27 @@ from uuid import (
 from pydantic import (
     BaseModel,
     Field,
-    field_validator,
+    TypeAdapter,
+    model_validator,
 )
 
 
+_BY_NAME = attrgetter("name")
+
+
+class _TimestampedModel(BaseModel):
+    """Base for entities whose updated_at defaults to their created_at."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def _default_updated_at(cls, data: Any) -> Any:
+        """Default updated_at to created_at, so new entities read the clock once."""
+        if isinstance(data, dict) and "updated_at" not in data:
+            created_at = data.get("created_at") or datetime.now()
+            data = {**data, "created_at": created_at, "updated_at": created_at}
+        return data
+
+
 class ItemCategory(str, Enum):
     """Inventory item categories."""
 
@@ -71,7 +98,7 @@ class DatabaseSchema(BaseModel):
     description: str
 
 
-class Supplier(BaseModel):
+class Supplier(_TimestampedModel):
     """Supplier entity."""
 
     id: str = Field(..., max_length=50, description="Supplier identifier")
@@ -83,7 +110,7 @@ class Supplier(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
 
 
-class Product(BaseModel):
+class Product(_TimestampedModel):
     """Product master data entity."""
 
     id: UUID = Field(default_factory=uuid4, description="Unique product identifier")
@@ -97,14 +124,8 @@ class Product(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now, description="Creation timestamp")
     updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
 
-    @field_validator("updated_at")
-    @classmethod
-    def set_updated_at(cls, _: datetime) -> datetime:
-        """Always update the updated_at timestamp."""
-        return datetime.now()
-
 
-class SupplierProduct(BaseModel):
+class SupplierProduct(_TimestampedModel):
     """Product-Supplier relationship entity."""
 
     id: UUID = Field(default_factory=uuid4, description="Unique relationship identifier")
@@ -119,8 +140,13 @@ class SupplierProduct(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
 
 
-class EnrichedInventoryItem(BaseModel):
-    """Inventory item enriched with product and supplier data for API responses."""
+@dataclass(frozen=True, slots=True)
+class EnrichedInventoryItem:
+    """Inventory item enriched with product and supplier data for API responses.
+
+    This is a derived, read-only view built from already validated entities, so it is a
+    plain frozen dataclass rather than a pydantic model and skips validation on every build.
+    """
 
     # Inventory data
     id: UUID
@@ -157,8 +183,12 @@ class EnrichedInventoryItem(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    def model_dump(self) -> Dict[str, Any]:
+        """Return the item as a dict, mirroring the pydantic BaseModel API."""
+        return asdict(self)
+
 
-class InventoryItem(BaseModel):
+class InventoryItem(_TimestampedModel):
     """Normalized inventory item - focuses only on inventory tracking."""
 
     id: UUID = Field(default_factory=uuid4, description="Unique inventory item identifier")
@@ -193,29 +223,79 @@ class InventoryItem(BaseModel):
         """Check if item needs to be reordered."""
         return self.available_quantity <= self.reorder_point
 
-    @field_validator("updated_at")
-    @classmethod
-    def set_updated_at(cls, _: datetime) -> datetime:
-        """Always update the updated_at timestamp."""
-        return datetime.now()
+    def touch(self) -> None:
+        """Set the updated_at timestamp to now; call after mutating the entity."""
+        self.updated_at = datetime.now()
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of a lowercased text."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
 
 
 class InventoryDatabase:  # pylint: disable=too-many-instance-attributes
-    """Normalized in-memory inventory database with CRUD operations."""
+    """Normalized in-memory inventory database with CRUD operations.
+
+    Internally every entity is keyed by the 16-byte ``UUID.bytes`` of its id, which hashes
+    natively and far faster than a UUID object. Public methods take and return UUIDs.
+    """
+
+    __slots__ = (
+        "_suppliers",
+        "_products",
+        "_supplier_products",
+        "_inventory_items",
+        "_product_name_index",
+        "_product_folded_names",
+        "_search_index",
+        "_product_sku_index",
+        "_category_index",
+        "_status_index",
+        "_low_stock_ids",
+        "_supplier_product_index",
+        "_inventory_product_index",
+        "_product_inventory_index",
+        "_primary_supplier_product_index",
+        "_total_value",
+        "_category_count",
+        "_enriched_cache",
+        "_dirty_items",
+        "_version",
+    )
 
     def __init__(self) -> None:
         # Core entities
         self._suppliers: Dict[str, Supplier] = {}
-        self._products: Dict[UUID, Product] = {}
-        self._supplier_products: Dict[UUID, SupplierProduct] = {}
-        self._inventory_items: Dict[UUID, InventoryItem] = {}
+        self._products: Dict[bytes, Product] = {}
+        self._supplier_products: Dict[bytes, SupplierProduct] = {}
+        self._inventory_items: Dict[bytes, InventoryItem] = {}
 
         # Indexes for fast lookups
-        self._product_name_index: Dict[str, UUID] = {}
-        self._product_sku_index: Dict[str, UUID] = {}
-        self._category_index: Dict[ItemCategory, List[UUID]] = {cat: [] for cat in ItemCategory}
-        self._supplier_product_index: Dict[UUID, List[UUID]] = {}  # product_id -> supplier_product ids
-        self._inventory_product_index: Dict[UUID, UUID] = {}  # inventory_id -> product_id
+        self._product_name_index: Dict[str, bytes] = {}
+        self._product_folded_names: Set[str] = set()  # lowercased names for duplicate checks
+        self._search_index: Dict[str, Set[bytes]] = {}  # trigram of name/description/sku -> product keys
+        self._product_sku_index: Dict[str, bytes] = {}
+        self._category_index: Dict[ItemCategory, List[bytes]] = {cat: [] for cat in ItemCategory}
+        self._status_index: Dict[ItemStatus, Set[bytes]] = {status: set() for status in ItemStatus}  # inventory keys
+        self._low_stock_ids: Set[bytes] = set()  # inventory keys that need reorder
+        self._supplier_product_index: Dict[bytes, List[bytes]] = {}  # product key -> supplier_product keys
+        self._inventory_product_index: Dict[bytes, bytes] = {}  # inventory key -> product key
+        self._product_inventory_index: Dict[bytes, List[bytes]] = {}  # product key -> inventory keys
+        self._primary_supplier_product_index: Dict[bytes, bytes] = {}  # product key -> primary supplier_product key
+        self._total_value = Decimal(0)  # sum of price * quantity_on_hand over inventory items
+        self._category_count: Dict[ItemCategory, int] = {cat: 0 for cat in ItemCategory}  # inventory items
+
+        # Enriched item cache; entries listed in _dirty_items are rebuilt on next access
+        self._enriched_cache: Dict[bytes, EnrichedInventoryItem] = {}
+        self._dirty_items: Set[bytes] = set()
+
+        # Bumped by every CRUD operation so callers can cache derived views
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever the database is modified."""
+        return self._version
 
     def add_supplier(self, supplier_obj: Supplier) -> Supplier:
         """Add a new supplier."""
@@ -223,12 +303,14 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes
             raise ValueError(f"Supplier with ID '{supplier_obj.id}' already exists")
 
         self._suppliers[supplier_obj.id] = supplier_obj
+        self._version += 1
         return supplier_obj
 
     def add_product(self, product_obj: Product) -> Product:
         """Add a new product."""
         # Check for duplicate names
-        if product_obj.name.lower() in [name.lower() for name in self._product_name_index]:
+        folded_name = product_obj.name.lower()
+        if folded_name in self._product_folded_names:
             raise ValueError(f"Product with name '{product_obj.name}' already exists")
 
         # Check for duplicate SKUs
@@ -236,45 +318,136 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes
             raise ValueError(f"Product with SKU '{product_obj.sku}' already exists")
 
         # Add to main storage and indexes
-        self._products[product_obj.id] = product_obj
-        self._product_name_index[product_obj.name] = product_obj.id
+        product_key = product_obj.id.bytes
+        self._products[product_key] = product_obj
+        self._product_name_index[product_obj.name] = product_key
+        self._product_folded_names.add(folded_name)
         if product_obj.sku:
-            self._product_sku_index[product_obj.sku] = product_obj.id
-        self._category_index[product_obj.category].append(product_obj.id)
-        self._supplier_product_index[product_obj.id] = []
+            self._product_sku_index[product_obj.sku] = product_key
+        self._category_index[product_obj.category].append(product_key)
+        self._supplier_product_index[product_key] = []
+        self._product_inventory_index.setdefault(product_key, [])
+        for text in (product_obj.name, product_obj.description, product_obj.sku):
+            if text:
+                for trigram in _trigrams(text.lower()):
+                    self._search_index.setdefault(trigram, set()).add(product_key)
+        self._mark_product_dirty(product_key)
+        self._version += 1
 
         return product_obj
 
     def add_supplier_product(self, supplier_product_obj: SupplierProduct) -> SupplierProduct:
         """Add a supplier-product relationship."""
-        if supplier_product_obj.product_id not in self._products:
+        product_key = supplier_product_obj.product_id.bytes
+        if product_key not in self._products:
             raise ValueError(f"Product with ID '{supplier_product_obj.product_id}' does not exist")
 
         if supplier_product_obj.supplier_id not in self._suppliers:
             raise ValueError(f"Supplier with ID '{supplier_product_obj.supplier_id}' does not exist")
 
-        self._supplier_products[supplier_product_obj.id] = supplier_product_obj
-        self._supplier_product_index[supplier_product_obj.product_id].append(supplier_product_obj.id)
+        supplier_product_key = supplier_product_obj.id.bytes
+        self._supplier_products[supplier_product_key] = supplier_product_obj
+        self._supplier_product_index[product_key].append(supplier_product_key)
+        if supplier_product_obj.is_primary_supplier:
+            # The first primary supplier registered for a product wins
+            self._primary_supplier_product_index.setdefault(product_key, supplier_product_key)
+        self._mark_product_dirty(product_key)
+        self._version += 1
 
         return supplier_product_obj
 
     def add_inventory_item(self, inventory_item_obj: InventoryItem) -> InventoryItem:
         """Add a new inventory item."""
-        if inventory_item_obj.product_id not in self._products:
+        product_key = inventory_item_obj.product_id.bytes
+        if product_key not in self._products:
             raise ValueError(f"Product with ID '{inventory_item_obj.product_id}' does not exist")
 
-        self._inventory_items[inventory_item_obj.id] = inventory_item_obj
-        self._inventory_product_index[inventory_item_obj.id] = inventory_item_obj.product_id
+        inventory_key = inventory_item_obj.id.bytes
+        if inventory_key in self._inventory_items:
+            raise ValueError(f"Inventory item with ID '{inventory_item_obj.id}' already exists")
+
+        self._inventory_items[inventory_key] = inventory_item_obj
+        self._inventory_product_index[inventory_key] = product_key
+        self._product_inventory_index[product_key].append(inventory_key)
+        self._category_count[self._products[product_key].category] += 1
+        self._status_index[inventory_item_obj.status].add(inventory_key)
+        if inventory_item_obj.needs_reorder:
+            self._low_stock_ids.add(inventory_key)
+        self._total_value += inventory_item_obj.price * inventory_item_obj.quantity_on_hand
+        self._dirty_items.add(inventory_key)
+        self._version += 1
 
         return inventory_item_obj
 
+    def update_inventory_item(self, inventory_id: UUID, **updates: Any) -> InventoryItem:
+        """Update fields of an inventory item, re-validating it and keeping aggregates in sync."""
+        inventory_key = inventory_id.bytes
+        inventory_item_obj = self._inventory_items.get(inventory_key)
+        if not inventory_item_obj:
+            raise ValueError(f"Inventory item with ID '{inventory_id}' does not exist")
+
+        if "id" in updates or "product_id" in updates:
+            raise ValueError("Inventory item 'id' and 'product_id' cannot be updated")
+
+        updated_item_obj = InventoryItem.model_validate({**inventory_item_obj.model_dump(), **updates})
+        updated_item_obj.touch()
+
+        self._inventory_items[inventory_key] = updated_item_obj
+        if updated_item_obj.status != inventory_item_obj.status:
+            self._status_index[inventory_item_obj.status].discard(inventory_key)
+            self._status_index[updated_item_obj.status].add(inventory_key)
+        if updated_item_obj.needs_reorder:
+            self._low_stock_ids.add(inventory_key)
+        else:
+            self._low_stock_ids.discard(inventory_key)
+        self._total_value += (
+            updated_item_obj.price * updated_item_obj.quantity_on_hand
+            - inventory_item_obj.price * inventory_item_obj.quantity_on_hand
+        )
+        self._dirty_items.add(inventory_key)
+        self._version += 1
+
+        return updated_item_obj
+
+    def update_status(self, inventory_id: UUID, new_status: ItemStatus) -> InventoryItem:
+        """Change the status of an inventory item."""
+        return self.update_inventory_item(inventory_id, status=new_status)
+
+    def _mark_product_dirty(self, product_key: bytes) -> None:
+        """Invalidate cached enriched items of every inventory item that references a product."""
+        self._dirty_items.update(self._product_inventory_index.get(product_key, []))
+
     def get_enriched_item(self, inventory_id: UUID) -> Optional[EnrichedInventoryItem]:
-        """Get enriched inventory item with product and supplier data."""
-        inventory_item_obj = self._inventory_items.get(inventory_id)
+        """Get enriched inventory item with product and supplier data.
+
+        Enriched items are cached and rebuilt only after a CRUD operation touches their
+        inventory item, product or supplier relationships. The returned object is shared
+        between callers and must be treated as read-only.
+        """
+        return self._get_enriched_item(inventory_id.bytes)
+
+    def _get_enriched_item(self, inventory_key: bytes) -> Optional[EnrichedInventoryItem]:
+        """Return the cached enriched item for an inventory key, rebuilding it if dirty."""
+        cached = self._enriched_cache.get(inventory_key)
+        if cached is not None and inventory_key not in self._dirty_items:
+            return cached
+
+        enriched_item = self._build_enriched_item(inventory_key)
+        self._dirty_items.discard(inventory_key)
+        if enriched_item is None:
+            self._enriched_cache.pop(inventory_key, None)
+        else:
+            self._enriched_cache[inventory_key] = enriched_item
+        return enriched_item
+
+    def _build_enriched_item(self, inventory_key: bytes) -> Optional[EnrichedInventoryItem]:
+        """Build an enriched inventory item from the normalized entities."""
+        inventory_item_obj = self._inventory_items.get(inventory_key)
         if not inventory_item_obj:
             return None
 
-        product_obj = self._products.get(inventory_item_obj.product_id)
+        product_key = self._inventory_product_index[inventory_key]
+        product_obj = self._products.get(product_key)
         if not product_obj:
             return None
 
@@ -284,16 +457,14 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes
         supplier_part_number = None
         cost = None
 
-        supplier_product_ids = self._supplier_product_index.get(product_obj.id, [])
-        for sp_id in supplier_product_ids:
-            supplier_product_obj = self._supplier_products.get(sp_id)
-            if supplier_product_obj and supplier_product_obj.is_primary_supplier:
-                supplier_id = supplier_product_obj.supplier_id
-                supplier_part_number = supplier_product_obj.supplier_part_number
-                cost = supplier_product_obj.cost
-                supplier_obj = self._suppliers.get(supplier_id)
-                supplier_name = supplier_obj.name if supplier_obj else None
-                break
+        primary_sp_key = self._primary_supplier_product_index.get(product_key)
+        supplier_product_obj = self._supplier_products.get(primary_sp_key) if primary_sp_key else None
+        if supplier_product_obj:
+            supplier_id = supplier_product_obj.supplier_id
+            supplier_part_number = supplier_product_obj.supplier_part_number
+            cost = supplier_product_obj.cost
+            supplier_obj = self._suppliers.get(supplier_id)
+            supplier_name = supplier_obj.name if supplier_obj else None
 
         # Calculate profit margin
         profit_margin = None
@@ -332,71 +503,114 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes
 
     def get_enriched_item_by_name(self, name: str) -> Optional[EnrichedInventoryItem]:
         """Get enriched inventory item by product name."""
-        product_id = self._product_name_index.get(name)
-        if not product_id:
+        product_key = self._product_name_index.get(name)
+        if not product_key:
             return None
 
         # Find inventory item for this product
-        for inventory_id, inv_product_id in self._inventory_product_index.items():
-            if inv_product_id == product_id:
-                return self.get_enriched_item(inventory_id)
+        inventory_keys = self._product_inventory_index.get(product_key)
+        if not inventory_keys:
+            return None
 
-        return None
+        return self._get_enriched_item(inventory_keys[0])
+
+    def iter_enriched_items(
+        self,
+        category: Optional[ItemCategory] = None,
+        status: Optional[ItemStatus] = None,
+        needs_reorder: Optional[bool] = None,
+    ) -> Iterator[EnrichedInventoryItem]:
+        """Lazily yield enriched inventory items matching the filters, in no particular order.
+
+        Items are enriched only when they are reached, so consumers that stop early skip
+        the rest. Do not add or update items while iterating.
+        """
+        # Filter on the normalized entities first so only matching items get enriched
+        candidate_keys: Iterable[bytes] = self._inventory_items
+        if status:
+            candidate_keys = self._status_index[status]
+        if category:
+            status_keys = self._status_index[status] if status else None
+            candidate_keys = (
+                inventory_key
+                for product_key in self._category_index[category]
+                for inventory_key in self._product_inventory_index.get(product_key, [])
+                if status_keys is None or inventory_key in status_keys
+            )
+
+        for inventory_key in candidate_keys:
+            if needs_reorder is not None and self._inventory_items[inventory_key].needs_reorder != needs_reorder:
+                continue
+            enriched_item = self._get_enriched_item(inventory_key)
+            if enriched_item:
+                yield enriched_item
 
     def list_enriched_items(
         self,
         category: Optional[ItemCategory] = None,
         status: Optional[ItemStatus] = None,
         needs_reorder: Optional[bool] = None,
+        limit: Optional[int] = None,
     ) -> List[EnrichedInventoryItem]:
-        """List enriched inventory items with optional filters."""
-        items = []
+        """List enriched inventory items with optional filters, sorted by name.
 
-        for inventory_id in self._inventory_items:
-            enriched_item = self.get_enriched_item(inventory_id)
+        With a limit, only the first ``limit`` items by name are returned, selected
+        without sorting the whole result.
+        """
+        items = self.iter_enriched_items(category, status, needs_reorder)
+        if limit is not None:
+            return nsmallest(limit, items, key=_BY_NAME)
+        return sorted(items, key=_BY_NAME)
+
+    def get_low_stock_items(self) -> List[EnrichedInventoryItem]:
+        """Get enriched items that need to be reordered."""
+        items = []
+        for inventory_key in self._low_stock_ids:
+            enriched_item = self._get_enriched_item(inventory_key)
             if enriched_item:
                 items.append(enriched_item)
+        return sorted(items, key=_BY_NAME)
 
-        if category:
-            items = [item for item in items if item.category == category]
-
-        if status:
-            items = [item for item in items if item.status == status]
-
-        if needs_reorder is not None:
-            items = [item for item in items if item.needs_reorder == needs_reorder]
+    def count_items(self, status: Optional[ItemStatus] = None) -> int:
+        """Count inventory items, optionally only those with the given status, without enriching them."""
+        return len(self._status_index[status]) if status else len(self._inventory_items)
 
-        return sorted(items, key=lambda x: x.name)
+    def count_low_stock_items(self) -> int:
+        """Count inventory items that need to be reordered."""
+        return len(self._low_stock_ids)
 
-    def get_low_stock_items(self) -> List[EnrichedInventoryItem]:
-        """Get enriched items that need to be reordered."""
-        return [item for item in self.list_enriched_items() if item.needs_reorder]
+    def count_out_of_stock_items(self) -> int:
+        """Count inventory items with nothing on hand."""
+        return sum(1 for item in self._inventory_items.values() if item.quantity_on_hand == 0)
 
     def get_inventory_value(self) -> Decimal:
         """Calculate total inventory value."""
-        total = sum(item.price * item.quantity_on_hand for item in self._inventory_items.values())
-        return Decimal(str(total))
+        return self._total_value
 
     def get_category_stats(self) -> Dict[str, int]:
         """Get item count by category."""
-        stats = {}
-        for category in ItemCategory:
-            count = 0
-            for inventory_id in self._inventory_items:
-                enriched_item = self.get_enriched_item(inventory_id)
-                if enriched_item and enriched_item.category == category:
-                    count += 1
-            if count > 0:
-                stats[category.value] = count
-        return stats
+        return {category.value: count for category, count in self._category_count.items() if count > 0}
 
     def search_enriched_items(self, query: str) -> List[EnrichedInventoryItem]:
         """Search enriched items by name, description, or SKU."""
         query_lower = query.lower()
         results = []
 
-        for inventory_id in self._inventory_items:
-            enriched_item = self.get_enriched_item(inventory_id)
+        # Narrow the scan to products containing every trigram of the query; shorter
+        # queries have no trigrams and still scan all items
+        candidate_keys: Iterable[bytes] = self._inventory_items
+        query_trigrams = _trigrams(query_lower)
+        if query_trigrams:
+            postings = sorted((self._search_index.get(trigram, set()) for trigram in query_trigrams), key=len)
+            product_keys = postings[0].intersection(*postings[1:])
+            candidate_keys = [
+                inventory_key
+                for product_key in product_keys
+                for inventory_key in self._product_inventory_index.get(product_key, [])
+            ]
+
+        for inventory_key in candidate_keys:
+            enriched_item = self._get_enriched_item(inventory_key)
             if not enriched_item:
                 continue
 
@@ -408,129 +622,146 @@ class InventoryDatabase:  # pylint: disable=too-many-instance-attributes
             if name_match or desc_match or sku_match:
                 results.append(enriched_item)
 
-        return sorted(results, key=lambda x: x.name)
-
-
-# Initialize the database
-db = InventoryDatabase()
-
-# Initialize with normalized sample data
-# Create sample suppliers
-suppliers_data = [
-    {"id": "SUP-001", "name": "Colombian Coffee Co.", "contact_email": "orders@colombiancoffee.com"},
-    {"id": "SUP-002", "name": "Tea Imports Ltd.", "contact_email": "sales@teaimports.com"},
-    {"id": "SUP-003", "name": "Local Bakery", "contact_phone": "555-0123"},
-    {"id": "SUP-004", "name": "TechSupply Inc.", "contact_email": "wholesale@techsupply.com"},
-    {"id": "SUP-005", "name": "Academic Publishers", "contact_email": "orders@academicpub.com"},
-]
-
-suppliers = [Supplier.model_validate(data) for data in suppliers_data]
-
-for supplier in suppliers:
-    db.add_supplier(supplier)
-    print(f"Added supplier: {supplier.id} - {supplier.name}")
-
-# Create sample products
-products_data = [
-    {
-        "name": "Premium Coffee Beans",
-        "description": "High-quality Arabica coffee beans from Colombia",
-        "category": ItemCategory.BEVERAGES,
-        "sku": "COF-001",
-        "weight": Decimal("1.0"),
-    },
-    {
-        "name": "Earl Grey Tea",
-        "description": "Classic Earl Grey black tea with bergamot",
-        "category": ItemCategory.BEVERAGES,
-        "sku": "TEA-001",
-    },
-    {
-        "name": "Chocolate Chip Cookies",
-        "description": "Fresh baked chocolate chip cookies",
-        "category": ItemCategory.FOOD,
-        "sku": "COOK-001",
-    },
-    {
-        "name": "Wireless Bluetooth Headphones",
-        "description": "High-quality wireless headphones with noise cancellation",
-        "category": ItemCategory.ELECTRONICS,
-        "sku": "ELEC-001",
-        "weight": Decimal("0.3"),
-    },
-    {
-        "name": "Python Programming Guide",
-        "description": "Comprehensive guide to Python programming",
-        "category": ItemCategory.BOOKS,
-        "sku": "BOOK-001",
-    },
-]
-
-products = [Product.model_validate(data) for data in products_data]
-
-for product in products:
-    db.add_product(product)
-    print(f"Added product: {product.id} - {product.name}")
-
-# Create supplier-product relationships
-supplier_products_data = [
-    {
-        "product_id": products[0].id,
-        "supplier_id": "SUP-001",
-        "cost": Decimal("6.50"),
-        "is_primary_supplier": True,
-        "lead_time_days": 14,
-        "minimum_order_quantity": 50,
-    },
-    {
-        "product_id": products[1].id,
-        "supplier_id": "SUP-002",
-        "cost": Decimal("4.25"),
-        "is_primary_supplier": True,
-        "lead_time_days": 7,
-        "minimum_order_quantity": 25,
-    },
-    {
-        "product_id": products[2].id,
-        "supplier_id": "SUP-003",
-        "cost": Decimal("2.50"),
-        "is_primary_supplier": True,
-        "lead_time_days": 1,
-        "minimum_order_quantity": 12,
-    },
-    {
-        "product_id": products[3].id,
-        "supplier_id": "SUP-004",
-        "cost": Decimal("120.00"),
-        "is_primary_supplier": True,
-        "lead_time_days": 21,
-        "minimum_order_quantity": 5,
-    },
-    {
-        "product_id": products[4].id,
-        "supplier_id": "SUP-005",
-        "cost": Decimal("25.00"),
-        "is_primary_supplier": True,
-        "lead_time_days": 10,
-        "minimum_order_quantity": 10,
-    },
-]
-
-supplier_products = [SupplierProduct.model_validate(data) for data in supplier_products_data]
-
-for supplier_product in supplier_products:
-    db.add_supplier_product(supplier_product)
-
-# Create inventory items
-inventory_items_data = [
-    {"product_id": products[0].id, "price": Decimal("12.99"), "quantity_on_hand": 150, "reorder_point": 20},
-    {"product_id": products[1].id, "price": Decimal("8.99"), "quantity_on_hand": 75, "reorder_point": 15},
-    {"product_id": products[2].id, "price": Decimal("5.99"), "quantity_on_hand": 25, "reorder_point": 30},
-    {"product_id": products[3].id, "price": Decimal("199.99"), "quantity_on_hand": 12, "reorder_point": 5},
-    {"product_id": products[4].id, "price": Decimal("39.99"), "quantity_on_hand": 8, "reorder_point": 3},
-]
-
-inventory_items = [InventoryItem.model_validate(data) for data in inventory_items_data]
-
-for inventory_item in inventory_items:
-    db.add_inventory_item(inventory_item)
+        return sorted(results, key=_BY_NAME)
+
+
+def seed_demo_data(database: InventoryDatabase) -> None:
+    """Populate a database with normalized sample suppliers, products and inventory items."""
+    # Create sample suppliers
+    suppliers_data = [
+        {"id": "SUP-001", "name": "Colombian Coffee Co.", "contact_email": "orders@colombiancoffee.com"},
+        {"id": "SUP-002", "name": "Tea Imports Ltd.", "contact_email": "sales@teaimports.com"},
+        {"id": "SUP-003", "name": "Local Bakery", "contact_phone": "555-0123"},
+        {"id": "SUP-004", "name": "TechSupply Inc.", "contact_email": "wholesale@techsupply.com"},
+        {"id": "SUP-005", "name": "Academic Publishers", "contact_email": "orders@academicpub.com"},
+    ]
+
+    suppliers = TypeAdapter(List[Supplier]).validate_python(suppliers_data)
+
+    for supplier in suppliers:
+        database.add_supplier(supplier)
+
+    # Create sample products
+    products_data = [
+        {
+            "name": "Premium Coffee Beans",
+            "description": "High-quality Arabica coffee beans from Colombia",
+            "category": ItemCategory.BEVERAGES,
+            "sku": "COF-001",
+            "weight": Decimal("1.0"),
+        },
+        {
+            "name": "Earl Grey Tea",
+            "description": "Classic Earl Grey black tea with bergamot",
+            "category": ItemCategory.BEVERAGES,
+            "sku": "TEA-001",
+        },
+        {
+            "name": "Chocolate Chip Cookies",
+            "description": "Fresh baked chocolate chip cookies",
+            "category": ItemCategory.FOOD,
+            "sku": "COOK-001",
+        },
+        {
+            "name": "Wireless Bluetooth Headphones",
+            "description": "High-quality wireless headphones with noise cancellation",
+            "category": ItemCategory.ELECTRONICS,
+            "sku": "ELEC-001",
+            "weight": Decimal("0.3"),
+        },
+        {
+            "name": "Python Programming Guide",
+            "description": "Comprehensive guide to Python programming",
+            "category": ItemCategory.BOOKS,
+            "sku": "BOOK-001",
+        },
+    ]
+
+    products = TypeAdapter(List[Product]).validate_python(products_data)
+
+    for product in products:
+        database.add_product(product)
+
+    # Create supplier-product relationships
+    supplier_products_data = [
+        {
+            "product_id": products[0].id,
+            "supplier_id": "SUP-001",
+            "cost": Decimal("6.50"),
+            "is_primary_supplier": True,
+            "lead_time_days": 14,
+            "minimum_order_quantity": 50,
+        },
+        {
+            "product_id": products[1].id,
+            "supplier_id": "SUP-002",
+            "cost": Decimal("4.25"),
+            "is_primary_supplier": True,
+            "lead_time_days": 7,
+            "minimum_order_quantity": 25,
+        },
+        {
+            "product_id": products[2].id,
+            "supplier_id": "SUP-003",
+            "cost": Decimal("2.50"),
+            "is_primary_supplier": True,
+            "lead_time_days": 1,
+            "minimum_order_quantity": 12,
+        },
+        {
+            "product_id": products[3].id,
+            "supplier_id": "SUP-004",
+            "cost": Decimal("120.00"),
+            "is_primary_supplier": True,
+            "lead_time_days": 21,
+            "minimum_order_quantity": 5,
+        },
+        {
+            "product_id": products[4].id,
+            "supplier_id": "SUP-005",
+            "cost": Decimal("25.00"),
+            "is_primary_supplier": True,
+            "lead_time_days": 10,
+            "minimum_order_quantity": 10,
+        },
+    ]
+
+    supplier_products = TypeAdapter(List[SupplierProduct]).validate_python(supplier_products_data)
+
+    for supplier_product in supplier_products:
+        database.add_supplier_product(supplier_product)
+
+    # Create inventory items
+    inventory_items_data = [
+        {"product_id": products[0].id, "price": Decimal("12.99"), "quantity_on_hand": 150, "reorder_point": 20},
+        {"product_id": products[1].id, "price": Decimal("8.99"), "quantity_on_hand": 75, "reorder_point": 15},
+        {"product_id": products[2].id, "price": Decimal("5.99"), "quantity_on_hand": 25, "reorder_point": 30},
+        {"product_id": products[3].id, "price": Decimal("199.99"), "quantity_on_hand": 12, "reorder_point": 5},
+        {"product_id": products[4].id, "price": Decimal("39.99"), "quantity_on_hand": 8, "reorder_point": 3},
+    ]
+
+    inventory_items = TypeAdapter(List[InventoryItem]).validate_python(inventory_items_data)
+
+    for inventory_item in inventory_items:
+        database.add_inventory_item(inventory_item)
+
+
+def __getattr__(name: str) -> Any:
+    """Create and seed the shared demo database on first access to ``db``.
+
+    Importing the models no longer pays for building the sample data, and nothing is
+    printed at import time, which would otherwise land on the stdout of stdio MCP servers.
+    """
+    if name == "db":
+        database = InventoryDatabase()
+        seed_demo_data(database)
+        globals()["db"] = database
+        return database
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    demo_db = InventoryDatabase()
+    seed_demo_data(demo_db)
+    for item in demo_db.list_enriched_items():
+        print(f"{item.id} - {item.name} ({item.supplier_name}): {item.quantity_on_hand} @ {item.price}")
@@ -0,0 +1,36 @@
+"""Single-server session helper shared by the example clients."""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from mcp import (
+    ClientSession,
+    StdioServerParameters,
+)
+from mcp.client.stdio import stdio_client
+
+
+@asynccontextmanager
+async def mcp_session(server_params: StdioServerParameters) -> AsyncIterator[ClientSession]:
+    """Open a single initialized session to a stdio MCP server.
+
+    The server subprocess is spawned once on entry and terminated on exit, so every
+    request made through the yielded session reuses the same connection. Callers
+    should keep the context open for the lifetime of their REPL or script instead of
+    opening a new session per call.
+
+    Args:
+        server_params: Parameters used to spawn the stdio server process.
+
+    Yields:
+        An initialized ClientSession connected to the server.
+
+    Examples:
+        >>> async with mcp_session(server_params) as session:
+        ...     tools = await session.list_tools()
+        ...     result = await session.call_tool("my_tool", {"arg": "value"})
+    """
+    async with stdio_client(server_params) as (read, write):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            yield session
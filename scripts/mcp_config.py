@@ -4,27 +4,54 @@ Python script to generate MCP server configuration.
 Handles file paths with spaces properly.
 """
 
-import json
 import re
 import sys
 import tempfile
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
     Optional,
 )
 
 
+# Prefer orjson for config (de)serialization when available, falling back to the stdlib
+_loads: Callable[[bytes], Any]
+_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
+# Matches FastMCP("servername"); scanned on raw bytes to skip decoding the whole file
+_FASTMCP_RE = re.compile(rb'FastMCP\(["\']([^"\']*)["\']')
+
+# FastMCP servers declare their instance near the top of the module, so only this much is scanned
+_FASTMCP_SCAN_BYTES = 16 * 1024
+
+
 def extract_server_name(filepath: Path) -> Optional[str]:
     """Extract server name from FastMCP() pattern in the file."""
     try:
-        content = filepath.read_text(encoding="utf-8")
+        with filepath.open("rb") as f:
+            content = f.read(_FASTMCP_SCAN_BYTES)
         # Look for FastMCP("servername") pattern
-        pattern = r'FastMCP\(["\']([^"\']*)["\']'
-        match = re.search(pattern, content)
+        match = _FASTMCP_RE.search(content)
         if match:
-            return match.group(1)
+            return match.group(1).decode("utf-8")
         return None
     except Exception as e:
         print(f"Error reading file {filepath}: {e}")
@@ -34,13 +61,14 @@ def extract_server_name(filepath: Path) -> Optional[str]:
 def create_or_update_config(server_name: str, filename: str, config_file: Path) -> bool:
     """Create or update the MCP configuration file."""
     try:
-        # Create default config if file doesn't exist
-        if not config_file.exists():
-            default_config: Dict[str, Any] = {"mcpServers": {}}
-            config_file.write_text(json.dumps(default_config, indent=2))
-
-        # Load existing config
-        config_data = json.loads(config_file.read_text(encoding="utf-8"))
+        # Load existing config, starting from an empty one if the file doesn't exist
+        config_data: Dict[str, Any]
+        existing_bytes: Optional[bytes] = None
+        try:
+            existing_bytes = config_file.read_bytes()
+            config_data = _loads(existing_bytes)
+        except FileNotFoundError:
+            config_data = {"mcpServers": {}}
 
         # Ensure mcpServers exists
         if "mcpServers" not in config_data:
@@ -62,9 +90,14 @@ def create_or_update_config(server_name: str, filename: str, config_file: Path)
             ],
         }
 
+        # Skip the write entirely when the file already has the same content
+        new_bytes = _dumps(config_data)
+        if new_bytes == existing_bytes:
+            return True
+
         # Write updated config using a temporary file for atomic operation
-        with tempfile.NamedTemporaryFile(mode="w", dir=config_file.parent, delete=False) as tmp:
-            json.dump(config_data, tmp, indent=2)
+        with tempfile.NamedTemporaryFile(mode="wb", dir=config_file.parent, delete=False) as tmp:
+            tmp.write(new_bytes)
             tmp_path = Path(tmp.name)
 
         # Atomically replace the original file
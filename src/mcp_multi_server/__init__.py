@@ -39,29 +39,76 @@ See Also:
 
 __version__ = "0.1.0"
 
-from .client import MultiServerClient
-from .config import (
-    MCPServersConfig,
-    ServerConfig,
-)
-from .exceptions import (
-    ConfigurationError,
-    MultiServerClientError,
-    PromptNotFoundError,
-    ResourceNotFoundError,
-    ServerNotFoundError,
-    ToolNotFoundError,
-)
-from .types import ServerCapabilities
-from .utils import (
-    extract_template_variables,
-    format_namespace_uri,
-    mcp_tools_to_openai_format,
-    parse_namespace_uri,
-    substitute_template_variables,
+import importlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Tuple,
 )
 
 
+if TYPE_CHECKING:
+    from .client import MultiServerClient
+    from .config import (
+        MCPServersConfig,
+        ServerConfig,
+    )
+    from .exceptions import (
+        ConfigurationError,
+        MultiServerClientError,
+        PromptNotFoundError,
+        ResourceNotFoundError,
+        ServerNotFoundError,
+        ToolNotFoundError,
+    )
+    from .types import ServerCapabilities
+    from .utils import (
+        extract_template_variables,
+        format_namespace_uri,
+        mcp_tools_to_openai_format,
+        parse_namespace_uri,
+        substitute_template_variables,
+    )
+
+
+# Public names are imported on first access (PEP 562) so that importing one submodule,
+# e.g. mcp_multi_server.utils, does not pull in the client and its dependencies.
+_LAZY_IMPORTS: Dict[str, Tuple[str, str]] = {
+    "MultiServerClient": (".client", "MultiServerClient"),
+    "MCPServersConfig": (".config", "MCPServersConfig"),
+    "ServerConfig": (".config", "ServerConfig"),
+    "ConfigurationError": (".exceptions", "ConfigurationError"),
+    "MultiServerClientError": (".exceptions", "MultiServerClientError"),
+    "PromptNotFoundError": (".exceptions", "PromptNotFoundError"),
+    "ResourceNotFoundError": (".exceptions", "ResourceNotFoundError"),
+    "ServerNotFoundError": (".exceptions", "ServerNotFoundError"),
+    "ToolNotFoundError": (".exceptions", "ToolNotFoundError"),
+    "ServerCapabilities": (".types", "ServerCapabilities"),
+    "extract_template_variables": (".utils", "extract_template_variables"),
+    "format_namespace_uri": (".utils", "format_namespace_uri"),
+    "mcp_tools_to_openai_format": (".utils", "mcp_tools_to_openai_format"),
+    "parse_namespace_uri": (".utils", "parse_namespace_uri"),
+    "substitute_template_variables": (".utils", "substitute_template_variables"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute on first access and cache it in the module namespace."""
+    try:
+        module_name, attr_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr_name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     # Main client class
     "MultiServerClient",
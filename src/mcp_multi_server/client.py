@@ -1,15 +1,20 @@
 """Multi-server MCP client for managing connections to multiple MCP servers."""
 
+import asyncio
 import json
 import logging
+import sys
 from contextlib import AsyncExitStack
 from datetime import timedelta
 from pathlib import Path
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -43,16 +48,20 @@ from .config import (
     ServerConfig,
 )
 from .types import ServerCapabilities
+from .utils import parse_namespace_uri
 
 
-# Configure logger for this module
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)-8s %(message)-60s %(filename)s:%(lineno)d",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
+# Prefer orjson for parsing the config file when it is installed. orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so callers see the same exception either way.
+json_loads: Callable[[bytes], Any]
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# Library logger: handlers and levels are left to the host application
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+logger.addHandler(logging.NullHandler())
 
 
 class MultiServerClient:
@@ -64,6 +73,10 @@ class MultiServerClient:
     - Routing tool, prompt and resource calls to the correct server
     - Managing session lifecycles with AsyncExitStack
 
+    Each server subprocess is spawned once in connect_all() and its session is reused for
+    every subsequent call until the client is closed, so routing a call never pays the
+    stdio spawn and initialization handshake again.
+
     The client can be used as an async context manager for automatic cleanup:
 
     Examples:
@@ -103,6 +116,14 @@ class MultiServerClient:
         self.capabilities: Dict[str, ServerCapabilities] = {}
         self.tool_to_server: Dict[str, str] = {}
         self.prompt_to_server: Dict[str, str] = {}
+        # Tool and prompt names offered by each server, for validating explicit server_name routing
+        self._server_tool_names: Dict[str, FrozenSet[str]] = {}
+        self._server_prompt_names: Dict[str, FrozenSet[str]] = {}
+        # Tools each server marks read-only, whose identical concurrent calls can share one request
+        self._read_only_tools: Dict[str, FrozenSet[str]] = {}
+        self._inflight_calls: Dict[Tuple[str, str, str, Optional[timedelta]], "asyncio.Future[CallToolResult]"] = {}
+        # Aggregated list_* results keyed by (capability kind, use_namespace)
+        self._list_cache: Dict[Tuple[str, bool], Any] = {}
         self._stack: Optional[AsyncExitStack] = None
         self._config: Optional[MCPServersConfig] = None
 
@@ -156,6 +177,11 @@ class MultiServerClient:
         instance.capabilities = {}
         instance.tool_to_server = {}
         instance.prompt_to_server = {}
+        instance._server_tool_names = {}
+        instance._server_prompt_names = {}
+        instance._read_only_tools = {}
+        instance._inflight_calls = {}
+        instance._list_cache = {}
         instance._stack = None
         instance._config = MCPServersConfig.model_validate(config_dict)
         return instance
@@ -217,8 +243,7 @@ class MultiServerClient:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
 
-        with open(self.config_path, encoding="utf-8") as f:
-            config_data = json.load(f)
+        config_data = json_loads(self.config_path.read_bytes())
 
         return MCPServersConfig.model_validate(config_data)
 
@@ -236,40 +261,53 @@ class MultiServerClient:
         Note:
             Individual server connection failures are caught and logged as warnings.
             The method will continue connecting to remaining servers if one fails.
+            The client only uses asyncio APIs, so it runs unchanged on uvloop. Installing
+            uvloop's policy before asyncio.run() lowers the per-await overhead of every
+            session request, as the chat client example does.
         """
         config = self._load_config()
 
         logger.info("Connecting to %d MCP servers...", len(config.mcpServers))
 
+        # Transports are entered on the stack sequentially from this task: stdio_client holds an
+        # anyio task group, which must be exited by the same task that entered it. Spawning is
+        # cheap; the slow initialize handshake and capability discovery then run concurrently.
+        opened: List[Tuple[str, ClientSession]] = []
         for server_name, server_config in config.mcpServers.items():
             try:
-                await self._connect_server(stack, server_name, server_config)
+                opened.append((server_name, await self._open_session(stack, server_name, server_config)))
             except Exception as e:
                 logger.warning("Failed to connect to %s: %s", server_name, e)
+
+        results = await asyncio.gather(
+            *(self._initialize_server(server_name, session) for server_name, session in opened),
+            return_exceptions=True,
+        )
+
+        # Register in configuration order so name collisions resolve the same way on every run
+        for (server_name, session), result in zip(opened, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning("Failed to connect to %s: %s", server_name, result)
                 continue
+            self.sessions[server_name] = session
+            self._register_capabilities(server_name, result)
 
         logger.info("Successfully connected to %d server(s)", len(self.sessions))
 
-    async def _connect_server(self, stack: AsyncExitStack, server_name: str, server_config: ServerConfig) -> None:
-        """Connect to a single MCP server and discover its capabilities.
+    async def _open_session(
+        self, stack: AsyncExitStack, server_name: str, server_config: ServerConfig
+    ) -> ClientSession:
+        """Spawn a server process and enter its stdio transport and session on the stack.
 
         Args:
             stack: AsyncExitStack for managing async context managers.
             server_name: Name identifier for this server.
             server_config: Server connection parameters.
 
-        Raises:
-            FileNotFoundError: If server command executable doesn't exist.
-            PermissionError: If lacking permission to execute server command.
-            OSError: If server process cannot be started.
-            McpError: If MCP protocol initialization fails.
-            TimeoutError: If connection or initialization times out.
-            pydantic.ValidationError: If server parameters are invalid.
-
-        Note:
-            Failures during capability discovery (tools, resources, prompts, templates)
-            are caught and logged as warnings. The server will still be registered with
-            partial capabilities if connection and initialization succeed.
+        Returns:
+            The (not yet initialized) client session.
         """
         logger.info("[%s] Connecting...", server_name)
 
@@ -278,74 +316,96 @@ class MultiServerClient:
 
         # Connect to server
         read, write = await stack.enter_async_context(stdio_client(params))
-        session = await stack.enter_async_context(ClientSession(read, write))
+        return await stack.enter_async_context(ClientSession(read, write))
+
+    async def _initialize_server(self, server_name: str, session: ClientSession) -> ServerCapabilities:
+        """Initialize a session and discover the server's capabilities.
+
+        Args:
+            server_name: Name identifier for this server.
+            session: Session returned by _open_session().
 
+        Returns:
+            The discovered capabilities. Capability types the server fails to list are
+            logged as warnings and left empty.
+        """
         # Initialize session
         await session.initialize()
-        self.sessions[server_name] = session
 
-        # Discover capabilities
+        # Discover capabilities; the four list requests are independent, so issue them concurrently
         capabilities = ServerCapabilities(name=server_name)
+        tools, resources, templates, prompts = await asyncio.gather(
+            session.list_tools(),
+            session.list_resources(),
+            session.list_resource_templates(),
+            session.list_prompts(),
+            return_exceptions=True,
+        )
 
-        # Get tools
-        try:
-            tools_result = await session.list_tools()
-            capabilities.tools = tools_result
-            logger.info("[%s] Found %d tool(s)", server_name, len(tools_result.tools))
-
-            # Map tools to server
-            for tool in tools_result.tools:
-                if tool.name in self.tool_to_server:
-                    existing_server = self.tool_to_server[tool.name]
-                    logger.warning(
-                        "Tool '%s' collision detected! Already provided by '%s', now overridden by '%s'",
-                        tool.name,
-                        existing_server,
-                        server_name,
-                    )
-                self.tool_to_server[tool.name] = server_name
+        if isinstance(tools, BaseException):
+            logger.warning("[%s] No tools available: %s", server_name, tools)
+        else:
+            capabilities.tools = tools
+            logger.info("[%s] Found %d tool(s)", server_name, len(tools.tools))
+
+        if isinstance(resources, BaseException):
+            logger.warning("[%s] No resources available: %s", server_name, resources)
+        else:
+            capabilities.resources = resources
+            logger.info("[%s] Found %d resource(s)", server_name, len(resources.resources))
 
-        except Exception as e:
-            logger.warning("[%s] No tools available: %s", server_name, e)
+        if isinstance(templates, BaseException):
+            logger.warning("[%s] No resource templates available: %s", server_name, templates)
+        else:
+            capabilities.resource_templates = templates
+            logger.info("[%s] Found %d resource template(s)", server_name, len(templates.resourceTemplates))
 
-        # Get resources
-        try:
-            resources_result = await session.list_resources()
-            capabilities.resources = resources_result
-            logger.info("[%s] Found %d resource(s)", server_name, len(resources_result.resources))
-        except Exception as e:
-            logger.warning("[%s] No resources available: %s", server_name, e)
+        if isinstance(prompts, BaseException):
+            logger.warning("[%s] No prompts available: %s", server_name, prompts)
+        else:
+            capabilities.prompts = prompts
+            logger.info("[%s] Found %d prompt(s)", server_name, len(prompts.prompts))
 
-        # Get resource templates
-        try:
-            templates_result = await session.list_resource_templates()
-            capabilities.resource_templates = templates_result
-            logger.info("[%s] Found %d resource template(s)", server_name, len(templates_result.resourceTemplates))
-        except Exception as e:
-            logger.warning("[%s] No resource templates available: %s", server_name, e)
+        return capabilities
 
-        # Get prompts
-        try:
-            prompts_result = await session.list_prompts()
-            capabilities.prompts = prompts_result
-            logger.info("[%s] Found %d prompt(s)", server_name, len(prompts_result.prompts))
-
-            # Map prompts to server
-            for prompt in prompts_result.prompts:
-                if prompt.name in self.prompt_to_server:
-                    existing_server = self.prompt_to_server[prompt.name]
-                    logger.warning(
-                        "Prompt '%s' collision detected! Already provided by '%s', now overridden by '%s'",
-                        prompt.name,
-                        existing_server,
-                        server_name,
-                    )
-                self.prompt_to_server[prompt.name] = server_name
+    def _register_capabilities(self, server_name: str, capabilities: ServerCapabilities) -> None:
+        """Record a server's capabilities and map its tools and prompts to it.
 
-        except Exception as e:
-            logger.warning("[%s] No prompts available: %s", server_name, e)
+        Args:
+            server_name: Name identifier for this server.
+            capabilities: Capabilities returned by _initialize_server().
+        """
+        # Map tools to server, reporting names another server already provides
+        if capabilities.tools:
+            tool_names = frozenset(tool.name for tool in capabilities.tools.tools)
+            for name in sorted(tool_names & self.tool_to_server.keys()):
+                logger.warning(
+                    "Tool '%s' collision detected! Already provided by '%s', now overridden by '%s'",
+                    name,
+                    self.tool_to_server[name],
+                    server_name,
+                )
+            self.tool_to_server.update(dict.fromkeys(tool_names, server_name))
+            self._server_tool_names[server_name] = tool_names
+            self._read_only_tools[server_name] = frozenset(
+                tool.name for tool in capabilities.tools.tools if tool.annotations and tool.annotations.readOnlyHint
+            )
+
+        # Map prompts to server, reporting names another server already provides
+        if capabilities.prompts:
+            prompt_names = frozenset(prompt.name for prompt in capabilities.prompts.prompts)
+            for name in sorted(prompt_names & self.prompt_to_server.keys()):
+                logger.warning(
+                    "Prompt '%s' collision detected! Already provided by '%s', now overridden by '%s'",
+                    name,
+                    self.prompt_to_server[name],
+                    server_name,
+                )
+            self.prompt_to_server.update(dict.fromkeys(prompt_names, server_name))
+            self._server_prompt_names[server_name] = prompt_names
 
         self.capabilities[server_name] = capabilities
+        self._list_cache.clear()
 
     def list_tools(self, cursor: Optional[str] = None) -> ListToolsResult:
         """Get combined list of all tools from all servers.
@@ -370,20 +430,33 @@ class MultiServerClient:
             >>> for tool in result.tools:
             ...     server = tool.meta.get("serverName") if tool.meta else None
             ...     print(f"{tool.name} from {server}")
+
+        Note:
+            The aggregated result is cached until a server's capabilities are registered
+            again, so repeated calls return the same object. Items without their own meta share
+            one meta dict per server. Treat the result and its items as read-only.
         """
         if cursor is not None:
             raise ValueError("Pagination not supported for multi-server aggregation")
 
+        cache_key = ("tools", False)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         all_tools: List[Tool] = []
         for server_name, capabilities in self.capabilities.items():
             if capabilities.tools:
+                server_meta = {"serverName": server_name}
                 for tool in capabilities.tools.tools:
                     # Add server name to tool's meta field
-                    existing_meta = tool.meta or {}
-                    tool_with_meta = tool.model_copy(update={"meta": {**existing_meta, "serverName": server_name}})
+                    meta = {**tool.meta, **server_meta} if tool.meta else server_meta
+                    tool_with_meta = tool.model_copy(update={"meta": meta})
                     all_tools.append(tool_with_meta)
 
-        return ListToolsResult(tools=all_tools, nextCursor=None)
+        result = ListToolsResult(tools=all_tools, nextCursor=None)
+        self._list_cache[cache_key] = result
+        return result
 
     def list_prompts(self, cursor: Optional[str] = None) -> ListPromptsResult:
         """Get combined list of all prompts from all servers.
@@ -408,20 +481,33 @@ class MultiServerClient:
             >>> for prompt in result.prompts:
             ...     server = prompt.meta.get("serverName") if prompt.meta else None
             ...     print(f"{prompt.name} from {server}")
+
+        Note:
+            The aggregated result is cached until a server's capabilities are registered
+            again, so repeated calls return the same object. Items without their own meta share
+            one meta dict per server. Treat the result and its items as read-only.
         """
         if cursor is not None:
             raise ValueError("Pagination not supported for multi-server aggregation")
 
+        cache_key = ("prompts", False)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         all_prompts: List[Prompt] = []
         for server_name, capabilities in self.capabilities.items():
             if capabilities.prompts:
+                server_meta = {"serverName": server_name}
                 for prompt in capabilities.prompts.prompts:
                     # Add server name to prompt's meta field
-                    existing_meta = prompt.meta or {}
-                    prompt_with_meta = prompt.model_copy(update={"meta": {**existing_meta, "serverName": server_name}})
+                    meta = {**prompt.meta, **server_meta} if prompt.meta else server_meta
+                    prompt_with_meta = prompt.model_copy(update={"meta": meta})
                     all_prompts.append(prompt_with_meta)
 
-        return ListPromptsResult(prompts=all_prompts, nextCursor=None)
+        result = ListPromptsResult(prompts=all_prompts, nextCursor=None)
+        self._list_cache[cache_key] = result
+        return result
 
     def list_resources(self, cursor: Optional[str] = None, use_namespace: bool = True) -> ListResourcesResult:
         """Get combined list of all resources from all servers.
@@ -451,25 +537,37 @@ class MultiServerClient:
             ...     server = resource.meta.get("serverName") if resource.meta else None
             ...     # URI is already namespaced: "filesystem:file:///path"
             ...     content = await client.read_resource(resource.uri)
+
+        Note:
+            The aggregated result is cached until a server's capabilities are registered
+            again, so repeated calls return the same object. Items without their own meta share
+            one meta dict per server. Treat the result and its items as read-only.
         """
         if cursor is not None:
             raise ValueError("Pagination not supported for multi-server aggregation")
 
+        cache_key = ("resources", use_namespace)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         all_resources: List[Resource] = []
         for server_name, capabilities in self.capabilities.items():
             if capabilities.resources:
+                server_meta = {"serverName": server_name}
                 for resource in capabilities.resources.resources:
                     # Add server name to meta and namespace the URI
-                    existing_meta = resource.meta or {}
                     resource_with_meta = resource.model_copy(
                         update={
                             "uri": f"{server_name}:{resource.uri}" if use_namespace else resource.uri,
-                            "meta": {**existing_meta, "serverName": server_name},
+                            "meta": {**resource.meta, **server_meta} if resource.meta else server_meta,
                         }
                     )
                     all_resources.append(resource_with_meta)
 
-        return ListResourcesResult(resources=all_resources, nextCursor=None)
+        result = ListResourcesResult(resources=all_resources, nextCursor=None)
+        self._list_cache[cache_key] = result
+        return result
 
     def list_resource_templates(
         self, cursor: Optional[str] = None, use_namespace: bool = True
@@ -502,27 +600,39 @@ class MultiServerClient:
             ...     # URI template is already namespaced: "filesystem:file:///{path}"
             ...     uri = template.uriTemplate.replace("{path}", "example.txt")
             ...     content = await client.read_resource(uri)
+
+        Note:
+            The aggregated result is cached until a server's capabilities are registered
+            again, so repeated calls return the same object. Items without their own meta share
+            one meta dict per server. Treat the result and its items as read-only.
         """
         if cursor is not None:
             raise ValueError("Pagination not supported for multi-server aggregation")
 
+        cache_key = ("resource_templates", use_namespace)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         all_templates: List[ResourceTemplate] = []
         for server_name, capabilities in self.capabilities.items():
             if capabilities.resource_templates:
+                server_meta = {"serverName": server_name}
                 for template in capabilities.resource_templates.resourceTemplates:
                     # Add server name to meta and namespace the URI template
-                    existing_meta = template.meta or {}
                     template_with_meta = template.model_copy(
                         update={
                             "uriTemplate": (
                                 f"{server_name}:{template.uriTemplate}" if use_namespace else template.uriTemplate
                             ),
-                            "meta": {**existing_meta, "serverName": server_name},
+                            "meta": {**template.meta, **server_meta} if template.meta else server_meta,
                         }
                     )
                     all_templates.append(template_with_meta)
 
-        return ListResourceTemplatesResult(resourceTemplates=all_templates, nextCursor=None)
+        result = ListResourceTemplatesResult(resourceTemplates=all_templates, nextCursor=None)
+        self._list_cache[cache_key] = result
+        return result
 
     def _create_error_result(self, error_message: str) -> CallToolResult:
         """Create a CallToolResult indicating an error.
@@ -549,7 +659,8 @@ class MultiServerClient:
         """Route a tool call to the appropriate server.
 
         Args:
-            name: Name of the tool to call.
+            name: Name of the tool to call. A "server:tool" name routes to that server, which
+                reaches a tool overridden by a same-named tool from a later server.
             arguments: Arguments to pass to the tool.
             read_timeout_seconds: Optional timeout for reading the tool result.
             progress_callback: Optional callback for progress notifications.
@@ -568,32 +679,80 @@ class MultiServerClient:
             Routing errors (unknown tool, unknown server) are returned as error results
             (isError=True) rather than raising exceptions, following MCP protocol conventions.
             Protocol-level errors from the underlying session are propagated as exceptions.
+            Concurrent calls to a tool annotated with readOnlyHint, made with identical
+            arguments and no progress_callback, share a single request and its result.
         """
+        session: Optional[ClientSession]
         if server_name is None:
             # Auto-route using the tool mapping
             server_name = self.tool_to_server.get(name)
             if not server_name:
-                return self._create_error_result(f"Unknown tool: {name}")
+                # Fall back to a "server:tool" name, which also reaches tools shadowed by a collision
+                qualified_server, tool_name = parse_namespace_uri(name)
+                if qualified_server is None or tool_name not in self._server_tool_names.get(qualified_server, ()):
+                    return self._create_error_result(f"Unknown tool: {name}")
+                server_name, name = qualified_server, tool_name
+            session = self.sessions[server_name]
         else:
             # Validate the explicitly provided server name
-            if server_name not in self.sessions:
+            session = self.sessions.get(server_name)
+            if session is None:
                 return self._create_error_result(f"Unknown server: {server_name}")
 
             # Validate that the tool exists on the specified server
-            server_capabilities = self.capabilities[server_name]
-            if server_capabilities.tools is None:
+            tool_names = self._server_tool_names.get(server_name)
+            if tool_names is None:
                 return self._create_error_result(f"Server '{server_name}' has no tools")
 
-            if name not in {tool.name for tool in server_capabilities.tools.tools}:
+            if name not in tool_names:
                 return self._create_error_result(f"Tool '{name}' not found in server '{server_name}'")
 
-        session = self.sessions[server_name]
-        return await session.call_tool(
-            name,
-            arguments,
-            read_timeout_seconds=read_timeout_seconds,
-            progress_callback=progress_callback,
-        )
+        key = self._inflight_key(server_name, name, arguments, read_timeout_seconds, progress_callback)
+        if key is None:
+            return await session.call_tool(
+                name,
+                arguments,
+                read_timeout_seconds=read_timeout_seconds,
+                progress_callback=progress_callback,
+            )
+
+        call = self._inflight_calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(session.call_tool(name, arguments, read_timeout_seconds=read_timeout_seconds))
+            self._inflight_calls[key] = call
+            call.add_done_callback(lambda _: self._inflight_calls.pop(key, None))
+        # Shield the shared request so one caller being cancelled doesn't cancel it for the others
+        return await asyncio.shield(call)
+
+    def _inflight_key(
+        self,
+        server_name: str,
+        name: str,
+        arguments: Dict[str, Any],
+        read_timeout_seconds: Optional[timedelta],
+        progress_callback: Optional[ProgressFnT],
+    ) -> Optional[Tuple[str, str, str, Optional[timedelta]]]:
+        """Return the key under which a tool call may share an in-flight request.
+
+        Args:
+            server_name: Server the call is routed to.
+            name: Name of the tool.
+            arguments: Arguments for the tool.
+            read_timeout_seconds: Read timeout for the call.
+            progress_callback: Progress callback for the call.
+
+        Returns:
+            A hashable key, or None if the call must be sent on its own: the tool is not
+            read-only, the caller wants progress notifications, or the arguments are not
+            JSON-serializable.
+        """
+        if progress_callback is not None or name not in self._read_only_tools.get(server_name, ()):
+            return None
+        try:
+            arguments_key = json.dumps(arguments, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return server_name, name, arguments_key, read_timeout_seconds
 
     async def read_resource(self, uri: Union[str, AnyUrl], server_name: Optional[str] = None) -> ReadResourceResult:
         """Read a resource with optional auto-routing via namespaced URIs.
@@ -628,16 +787,15 @@ class MultiServerClient:
             with MCP SDK behavior.
         """
         # Convert AnyUrl to string for processing
-        uri_str = str(uri)
+        uri_str = uri if isinstance(uri, str) else str(uri)
         actual_uri = uri_str
 
         if server_name is None:
             # Try to extract server from namespaced URI
-            if ":" in uri_str:
-                potential_server, potential_uri = uri_str.split(":", 1)
-                if potential_server in self.sessions:
-                    server_name = potential_server
-                    actual_uri = potential_uri
+            potential_server, potential_uri = parse_namespace_uri(uri_str)
+            if potential_server in self.sessions:
+                server_name = potential_server
+                actual_uri = potential_uri
 
             if server_name is None:
                 raise McpError(
@@ -651,6 +809,9 @@ class MultiServerClient:
         if not session:
             raise McpError(ErrorData(code=-32601, message=f"Unknown server: {server_name}"))
 
+        # Reuse a caller-supplied AnyUrl when no namespace was stripped, skipping a second URL validation
+        if isinstance(uri, AnyUrl) and actual_uri == uri_str:
+            return await session.read_resource(uri)
         return await session.read_resource(AnyUrl(actual_uri))
 
     async def get_prompt(
@@ -662,7 +823,8 @@ class MultiServerClient:
         """Get a prompt by automatically routing to the appropriate server.
 
         Args:
-            name: Name of the prompt to get.
+            name: Name of the prompt to get. A "server:prompt" name routes to that server, which
+                reaches a prompt overridden by a same-named prompt from a later server.
             arguments: Optional arguments for the prompt.
             server_name: Optional server name to explicitly specify which server to use.
                 If not provided, the server will be automatically determined from the prompt name.
@@ -678,54 +840,59 @@ class MultiServerClient:
             Raises McpError for both routing errors and protocol-level errors to align
             with MCP SDK behavior.
         """
+        session: Optional[ClientSession]
         if server_name is None:
             # Auto-route using the prompt mapping
             server_name = self.prompt_to_server.get(name)
             if not server_name:
-                raise McpError(ErrorData(code=-32601, message=f"Unknown prompt: {name}"))
+                # Fall back to a "server:prompt" name, which also reaches prompts shadowed by a collision
+                qualified_server, prompt_name = parse_namespace_uri(name)
+                if qualified_server is None or prompt_name not in self._server_prompt_names.get(qualified_server, ()):
+                    raise McpError(ErrorData(code=-32601, message=f"Unknown prompt: {name}"))
+                server_name, name = qualified_server, prompt_name
+            session = self.sessions[server_name]
         else:
             # Validate the explicitly provided server name
-            if server_name not in self.sessions:
+            session = self.sessions.get(server_name)
+            if session is None:
                 raise McpError(ErrorData(code=-32601, message=f"Unknown server: {server_name}"))
 
             # Validate that the prompt exists on the specified server
-            server_capabilities = self.capabilities[server_name]
-            if server_capabilities.prompts is None:
+            prompt_names = self._server_prompt_names.get(server_name)
+            if prompt_names is None:
                 raise McpError(ErrorData(code=-32601, message=f"Server '{server_name}' has no prompts"))
 
-            if name not in {prompt.name for prompt in server_capabilities.prompts.prompts}:
+            if name not in prompt_names:
                 raise McpError(ErrorData(code=-32601, message=f"Prompt '{name}' not found in server '{server_name}'"))
 
-        session = self.sessions[server_name]
         return await session.get_prompt(name, arguments=arguments or {})
 
     def print_capabilities_summary(self) -> None:
         """Print a summary of all discovered capabilities."""
-        print("\n" + "=" * 80)
-        print("CAPABILITIES SUMMARY")
-        print("=" * 80)
+        # Collect the lines and write them in one call instead of one print() per line
+        lines = ["", "=" * 80, "CAPABILITIES SUMMARY", "=" * 80]
 
         for server_name, caps in self.capabilities.items():
-            print(f"\n[{server_name}]")
+            lines.append(f"\n[{server_name}]")
 
             if caps.tools and caps.tools.tools:
-                print(f"  Tools ({len(caps.tools.tools)}):")
-                for tool in caps.tools.tools:
-                    print(f"    - {tool.name}: {tool.description}")
+                lines.append(f"  Tools ({len(caps.tools.tools)}):")
+                lines.extend(f"    - {tool.name}: {tool.description}" for tool in caps.tools.tools)
 
             if caps.resources and caps.resources.resources:
-                print(f"  Resources ({len(caps.resources.resources)}):")
-                for resource in caps.resources.resources:
-                    print(f"    - {resource.name}: {resource.uri}")
+                lines.append(f"  Resources ({len(caps.resources.resources)}):")
+                lines.extend(f"    - {resource.name}: {resource.uri}" for resource in caps.resources.resources)
 
             if caps.resource_templates and caps.resource_templates.resourceTemplates:
-                print(f"  Resource Templates ({len(caps.resource_templates.resourceTemplates)}):")
-                for template in caps.resource_templates.resourceTemplates:
-                    print(f"    - {template.name}: {template.uriTemplate}")
+                lines.append(f"  Resource Templates ({len(caps.resource_templates.resourceTemplates)}):")
+                lines.extend(
+                    f"    - {template.name}: {template.uriTemplate}"
+                    for template in caps.resource_templates.resourceTemplates
+                )
 
             if caps.prompts and caps.prompts.prompts:
-                print(f"  Prompts ({len(caps.prompts.prompts)}):")
-                for prompt in caps.prompts.prompts:
-                    print(f"    - {prompt.name}: {prompt.description}")
+                lines.append(f"  Prompts ({len(caps.prompts.prompts)}):")
+                lines.extend(f"    - {prompt.name}: {prompt.description}" for prompt in caps.prompts.prompts)
 
-        print("\n" + "=" * 80 + "\n")
+        lines.extend(["", "=" * 80, ""])
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -8,7 +8,7 @@ class MultiServerClientError(Exception):
     making it easy to catch all client-specific errors.
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(MultiServerClientError):
@@ -25,7 +25,7 @@ class ConfigurationError(MultiServerClientError):
         >>> raise ConfigurationError("Invalid server config: missing 'command' field")
     """
 
-    pass
+    __slots__ = ()
 
 
 class ServerNotFoundError(MultiServerClientError):
@@ -40,7 +40,7 @@ class ServerNotFoundError(MultiServerClientError):
         >>> raise ServerNotFoundError("Server 'tool_server' is not connected")
     """
 
-    pass
+    __slots__ = ()
 
 
 class ToolNotFoundError(MultiServerClientError):
@@ -55,7 +55,7 @@ class ToolNotFoundError(MultiServerClientError):
         >>> raise ToolNotFoundError("Tool 'add_member' not found in server 'resource_server'")
     """
 
-    pass
+    __slots__ = ()
 
 
 class PromptNotFoundError(MultiServerClientError):
@@ -70,7 +70,7 @@ class PromptNotFoundError(MultiServerClientError):
         >>> raise PromptNotFoundError("Prompt 'roleplay' not found in server 'tool_server'")
     """
 
-    pass
+    __slots__ = ()
 
 
 class ResourceNotFoundError(MultiServerClientError):
@@ -86,4 +86,4 @@ class ResourceNotFoundError(MultiServerClientError):
         >>> raise ResourceNotFoundError("Resource not found: filesystem:file:///missing.txt")
     """
 
-    pass
+    __slots__ = ()
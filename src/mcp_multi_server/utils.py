@@ -1,16 +1,27 @@
 """Utility functions for MCP multi-server client."""
 
 import re
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
     List,
+    Tuple,
 )
 from urllib.parse import quote
 
 from mcp.types import Tool
 
 
+_TEMPLATE_VAR_RE = re.compile(r"\{([^}]+)\}")
+
+
+# Per-Tool memo of converted definitions. Entries keep the Tool alive so a recycled id()
+# can never match, and the memo is cleared when it reaches its bound.
+_TOOL_MEMO_MAX_SIZE = 1024
+_tool_memo: Dict[int, Tuple[Tool, Dict[str, Any]]] = {}
+
+
 def mcp_tools_to_openai_format(tools: List[Tool]) -> List[Dict[str, Any]]:
     """Convert MCP tools to OpenAI function calling format.
 
@@ -42,9 +53,24 @@ def mcp_tools_to_openai_format(tools: List[Tool]) -> List[Dict[str, Any]]:
     Note:
         The inputSchema from MCP tools is used directly as the parameters
         field in OpenAI format, as both follow JSON Schema specifications.
+        Converted definitions are cached per Tool object, so converting the same tools
+        again returns the same dicts; treat them as read-only. A Tool whose name,
+        description or inputSchema was reassigned since its last conversion is
+        converted again.
     """
-    return [
-        {
+    result: List[Dict[str, Any]] = []
+    for tool in tools:
+        entry = _tool_memo.get(id(tool))
+        if entry is not None and entry[0] is tool:
+            function = entry[1]["function"]
+            if (
+                function["name"] == tool.name
+                and function["description"] == tool.description
+                and function["parameters"] is tool.inputSchema
+            ):
+                result.append(entry[1])
+                continue
+        definition = {
             "type": "function",
             "function": {
                 "name": tool.name,
@@ -52,8 +78,11 @@ def mcp_tools_to_openai_format(tools: List[Tool]) -> List[Dict[str, Any]]:
                 "parameters": tool.inputSchema,
             },
         }
-        for tool in tools
-    ]
+        if len(_tool_memo) >= _TOOL_MEMO_MAX_SIZE:
+            _tool_memo.clear()
+        _tool_memo[id(tool)] = (tool, definition)
+        result.append(definition)
+    return result
 
 
 def format_namespace_uri(server_name: str, uri: str) -> str:
@@ -101,11 +130,14 @@ def parse_namespace_uri(namespaced_uri: str) -> tuple[str | None, str]:
         This function looks for the first colon to determine if a namespace exists.
         It does not validate that the extracted server name actually exists.
     """
-    if ":" in namespaced_uri:
-        parts = namespaced_uri.split(":", 1)
-        if len(parts) == 2:
-            return parts[0], parts[1]
-    return None, namespaced_uri
+    server_name, separator, uri = namespaced_uri.partition(":")
+    return (server_name, uri) if separator else (None, namespaced_uri)
+
+
+@lru_cache(maxsize=256)
+def _template_variables(uri_template: str) -> Tuple[str, ...]:
+    """Return the cached variable names of a URI template, in order of appearance."""
+    return tuple(_TEMPLATE_VAR_RE.findall(uri_template))
 
 
 def extract_template_variables(uri_template: str) -> List[str]:
@@ -127,8 +159,7 @@ def extract_template_variables(uri_template: str) -> List[str]:
         >>> extract_template_variables("no/variables/here")
         []
     """
-    pattern = r"\{([^}]+)\}"
-    return re.findall(pattern, uri_template)
+    return list(_template_variables(uri_template))
 
 
 def substitute_template_variables(uri_template: str, variables: Dict[str, str]) -> str:
@@ -157,7 +188,8 @@ def substitute_template_variables(uri_template: str, variables: Dict[str, str])
 
     Note:
         Values are URL-encoded using urllib.parse.quote with safe="" to ensure
-        proper handling of special characters in URIs.
+        proper handling of special characters in URIs. Placeholders without a
+        matching entry in variables are left unchanged.
     """
     result = uri_template
     for var, value in variables.items():
@@ -0,0 +1,111 @@
+"""Tests for the chat client example's directive parsing, model routing and history trimming."""
+
+from collections import deque
+
+import pytest
+
+
+pytest.importorskip("openai")
+
+from examples.clients.chat_client import (  # noqa: E402
+    MODEL,
+    ROUTER_MODEL,
+    choose_model,
+    parse_directives,
+    trim_history,
+)
+
+
+NAMES = {
+    "prompt": {"review": None, "code review": None},
+    "resource": {"notes": None},
+    "template": {},
+}
+
+
+class TestParseDirectives:
+    """Tests for parse_directives."""
+
+    def test_directives_followed_by_question(self) -> None:
+        """Test that known names are split from the trailing question."""
+        directives, question = parse_directives("+prompt:review +resource:notes What changed?", NAMES)
+
+        assert directives == [("prompt", "review"), ("resource", "notes")]
+        assert question == "What changed?"
+
+    def test_whitespace_after_colon(self) -> None:
+        """Test that whitespace after the colon is not part of the name."""
+        directives, question = parse_directives("+prompt: review +resource:  notes", NAMES)
+
+        assert directives == [("prompt", "review"), ("resource", "notes")]
+        assert question == ""
+
+    def test_names_with_spaces(self) -> None:
+        """Test that a name runs up to the next directive and may contain spaces."""
+        directives, question = parse_directives("+prompt:code review +resource:notes", NAMES)
+
+        assert directives == [("prompt", "code review"), ("resource", "notes")]
+        assert question == ""
+
+    def test_longest_known_name_before_question(self) -> None:
+        """Test that the last directive takes the longest known name before the question."""
+        directives, question = parse_directives("+prompt:code review What changed?", NAMES)
+
+        assert directives == [("prompt", "code review")]
+        assert question == "What changed?"
+
+    def test_unknown_name_takes_rest_of_line(self) -> None:
+        """Test that without a known name the whole text is taken as the name."""
+        directives, question = parse_directives("+prompt:daily standup notes")
+
+        assert directives == [("prompt", "daily standup notes")]
+        assert question == ""
+
+    def test_no_leading_directive(self) -> None:
+        """Test that directives are only parsed at the start of the line."""
+        directives, question = parse_directives("What does +prompt:review do?", NAMES)
+
+        assert directives == []
+        assert question == "What does +prompt:review do?"
+
+
+class TestChooseModel:
+    """Tests for choose_model."""
+
+    TOOL_INDEX = [({"type": "function", "function": {"name": "get_weather"}}, frozenset({"get", "weather"}))]
+
+    def test_short_unrelated_question_uses_router(self) -> None:
+        """Test that a short question without tool words goes to the router model."""
+        assert choose_model("Tell me a joke", self.TOOL_INDEX) == ROUTER_MODEL
+
+    def test_follow_up_after_tool_call_uses_main_model(self) -> None:
+        """Test that a short follow-up keeps the main model once tools were called."""
+        messages = [
+            {"role": "user", "content": "Weather in Paris?"},
+            {"role": "assistant", "content": None, "tool_calls": [{"id": "1"}]},
+            {"role": "tool", "tool_call_id": "1", "content": "Sunny"},
+            {"role": "assistant", "content": "It is sunny."},
+            {"role": "user", "content": "and tomorrow?"},
+        ]
+
+        assert choose_model("and tomorrow?", self.TOOL_INDEX, messages) == MODEL
+
+
+class TestTrimHistory:
+    """Tests for trim_history."""
+
+    def test_current_turn_is_never_dropped(self) -> None:
+        """Test that a large resource of the current turn survives trimming."""
+        messages = deque(
+            [
+                {"role": "system", "content": "You are helpful."},
+                {"role": "user", "content": "old question"},
+                {"role": "assistant", "content": "old answer"},
+                {"role": "user", "content": "x" * 4000},
+                {"role": "user", "content": "What changed?"},
+            ]
+        )
+
+        trim_history(messages, max_tokens=100, keep=2)
+
+        assert [message["content"] for message in messages] == ["You are helpful.", "x" * 4000, "What changed?"]
@@ -68,6 +68,22 @@ class TestClientInitialization:
         assert client.config_path == invalid_file
         assert client._config is None
 
+    def test_load_config_reads_file(self, sample_config_file: Path) -> None:
+        """Test the config file is parsed on demand."""
+        client = MultiServerClient(sample_config_file)
+
+        config = client._load_config()
+        assert set(config.mcpServers) == {"tool_server", "resource_server", "prompt_server"}
+
+    def test_load_config_with_invalid_json_raises_json_error(self, tmp_path: Path) -> None:
+        """Test invalid JSON raises json.JSONDecodeError regardless of the JSON backend."""
+        invalid_file = tmp_path / "invalid.json"
+        invalid_file.write_text("{ this is not valid json }")
+
+        client = MultiServerClient(invalid_file)
+        with pytest.raises(json.JSONDecodeError):
+            client._load_config()
+
     def test_init_with_invalid_config_schema_succeeds(self, tmp_path: Path) -> None:
         """Test initialization with invalid schema succeeds (lazy loading)."""
         invalid_file = tmp_path / "invalid_schema.json"
@@ -249,6 +265,39 @@ class TestConnectionManagement:
                     assert "resource_server" in client.sessions
                     assert "prompt_server" in client.sessions
 
+    @pytest.mark.asyncio
+    async def test_connect_all_keeps_capabilities_when_one_listing_fails(
+        self, minimal_config_dict: Dict[str, Any]
+    ) -> None:
+        """Test a failing capability listing does not discard the others."""
+        from mcp.types import ListPromptsResult, ListToolsResult, Prompt, Tool
+
+        client = MultiServerClient.from_dict(minimal_config_dict)
+
+        with patch("mcp_multi_server.client.stdio_client") as mock_stdio:
+            mock_stdio.return_value.__aenter__ = AsyncMock(return_value=(MagicMock(), MagicMock()))
+            mock_stdio.return_value.__aexit__ = AsyncMock()
+
+            with patch("mcp_multi_server.client.ClientSession") as mock_session_class:
+                mock_session = MagicMock()
+                mock_session.initialize = AsyncMock()
+                mock_session.list_tools = AsyncMock(
+                    return_value=ListToolsResult(tools=[Tool(name="echo", inputSchema={"type": "object"})])
+                )
+                mock_session.list_resources = AsyncMock(side_effect=Exception("Method not found"))
+                mock_session.list_resource_templates = AsyncMock(side_effect=Exception("Method not found"))
+                mock_session.list_prompts = AsyncMock(return_value=ListPromptsResult(prompts=[Prompt(name="greet")]))
+                mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+                mock_session_class.return_value = mock_session
+
+                async with client:
+                    (server_name,) = client.sessions
+                    capabilities = client.capabilities[server_name]
+                    assert capabilities.resources is None
+                    assert capabilities.resource_templates is None
+                    assert client.tool_to_server == {"echo": server_name}
+                    assert client.prompt_to_server == {"greet": server_name}
+
 
 class TestCapabilityAggregation:
     """Tests for aggregating capabilities from multiple servers."""
@@ -285,6 +334,33 @@ class TestCapabilityAggregation:
         # Check that server attribution is added
         assert result.tools[0].meta.get("serverName") == "tool_server"
 
+    def test_list_tools_is_cached_until_capabilities_change(
+        self,
+        sample_config_dict: Dict[str, Any],
+        sample_tools: list,
+    ) -> None:
+        """Test list_tools reuses its result until new capabilities are registered."""
+        from mcp_multi_server.types import ServerCapabilities
+        from mcp.types import ListToolsResult
+
+        client = MultiServerClient.from_dict(sample_config_dict)
+        client._register_capabilities(
+            "tool_server",
+            ServerCapabilities(name="tool_server", tools=ListToolsResult(tools=sample_tools[:1], nextCursor=None)),
+        )
+
+        first = client.list_tools()
+        assert client.list_tools() is first
+
+        client._register_capabilities(
+            "other_server",
+            ServerCapabilities(name="other_server", tools=ListToolsResult(tools=sample_tools[1:], nextCursor=None)),
+        )
+
+        second = client.list_tools()
+        assert second is not first
+        assert [tool.name for tool in second.tools] == ["get_weather", "calculate"]
+
     def test_list_resources_aggregates_from_all_servers(
         self,
         sample_config_dict: Dict[str, Any],
@@ -412,6 +488,72 @@ class TestToolRouting:
         assert result.isError is True
         assert "Unknown server" in result.content[0].text
 
+    @pytest.mark.asyncio
+    async def test_call_tool_with_explicit_server_validates_tool_name(
+        self,
+        sample_config_dict: Dict[str, Any],
+        sample_tools: list,
+        mock_tool_server: MagicMock
+    ) -> None:
+        """Test call_tool with explicit server only accepts tools that server provides."""
+        from mcp_multi_server.types import ServerCapabilities
+        from mcp.types import ListToolsResult
+
+        client = MultiServerClient.from_dict(sample_config_dict)
+        client.sessions = {"tool_server": mock_tool_server}
+        client._register_capabilities(
+            "tool_server",
+            ServerCapabilities(name="tool_server", tools=ListToolsResult(tools=sample_tools, nextCursor=None)),
+        )
+
+        result = await client.call_tool("get_forecast", {}, server_name="tool_server")
+        assert result.isError is True
+        assert "not found in server 'tool_server'" in result.content[0].text
+        mock_tool_server.call_tool.assert_not_called()
+
+        await client.call_tool("get_weather", {"location": "Paris"}, server_name="tool_server")
+        mock_tool_server.call_tool.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_call_tool_coalesces_concurrent_read_only_calls(self, sample_config_dict: Dict[str, Any]) -> None:
+        """Test identical concurrent calls share one request only for read-only tools."""
+        import asyncio
+
+        from mcp_multi_server.types import ServerCapabilities
+        from mcp.types import CallToolResult, ListToolsResult, TextContent, Tool, ToolAnnotations
+
+        release = asyncio.Event()
+
+        async def slow_call_tool(name: str, arguments: Dict[str, Any], **kwargs: Any) -> CallToolResult:
+            await release.wait()
+            return CallToolResult(content=[TextContent(type="text", text=name)], isError=False)
+
+        server = MagicMock()
+        server.call_tool = AsyncMock(side_effect=slow_call_tool)
+        tools = [
+            Tool(name="lookup", inputSchema={"type": "object"}, annotations=ToolAnnotations(readOnlyHint=True)),
+            Tool(name="create", inputSchema={"type": "object"}),
+        ]
+
+        client = MultiServerClient.from_dict(sample_config_dict)
+        client.sessions = {"tool_server": server}
+        client._register_capabilities(
+            "tool_server", ServerCapabilities(name="tool_server", tools=ListToolsResult(tools=tools))
+        )
+
+        calls = [
+            asyncio.ensure_future(client.call_tool(name, {"id": 1}))
+            for name in ("lookup", "lookup", "create", "create")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*calls)
+
+        assert [result.content[0].text for result in results] == ["lookup", "lookup", "create", "create"]
+        assert results[0] is results[1]
+        assert server.call_tool.call_count == 3
+        assert client._inflight_calls == {}
+
 
 class TestResourceRouting:
     """Tests for resource routing to appropriate servers."""
@@ -436,6 +578,23 @@ class TestResourceRouting:
         # The mock server is called with AnyUrl type
         mock_resource_server.read_resource.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_read_resource_with_explicit_server_reuses_anyurl(
+        self,
+        sample_config_dict: Dict[str, Any],
+        mock_resource_server: MagicMock,
+    ) -> None:
+        """Test read_resource passes a caller's AnyUrl through when no namespace is stripped."""
+        from pydantic import AnyUrl
+
+        client = MultiServerClient.from_dict(sample_config_dict)
+        client.sessions = {"resource_server": mock_resource_server}
+
+        uri = AnyUrl("inventory://overview")
+        await client.read_resource(uri, server_name="resource_server")
+
+        assert mock_resource_server.read_resource.call_args.args[0] is uri
+
     @pytest.mark.asyncio
     async def test_read_resource_without_namespace_raises_mcperror(
         self,
@@ -567,6 +726,63 @@ class TestCollisionDetection:
         # The routing map should have the last server
         assert client.prompt_to_server["write_report"] == "server2"
 
+    def test_register_capabilities_logs_tool_collisions(
+        self,
+        sample_config_dict: Dict[str, Any],
+        sample_tools: list,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test registering overlapping tools warns once per colliding name and last server wins."""
+        from mcp_multi_server.types import ServerCapabilities
+        from mcp.types import ListToolsResult
+
+        client = MultiServerClient.from_dict(sample_config_dict)
+        client._register_capabilities(
+            "server1", ServerCapabilities(name="server1", tools=ListToolsResult(tools=sample_tools))
+        )
+
+        with caplog.at_level("WARNING", logger="mcp_multi_server.client"):
+            client._register_capabilities(
+                "server2", ServerCapabilities(name="server2", tools=ListToolsResult(tools=sample_tools[:1]))
+            )
+
+        assert client.tool_to_server == {"get_weather": "server2", "calculate": "server1"}
+        assert [record.getMessage() for record in caplog.records] == [
+            "Tool 'get_weather' collision detected! Already provided by 'server1', now overridden by 'server2'"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_call_tool_with_qualified_name_reaches_shadowed_tool(
+        self,
+        sample_config_dict: Dict[str, Any],
+        sample_tools: list,
+        mock_tool_server: MagicMock,
+    ) -> None:
+        """Test a "server:tool" name routes to a server whose tool lost a collision."""
+        from mcp_multi_server.types import ServerCapabilities
+        from mcp.types import ListToolsResult
+
+        other_server = MagicMock()
+        other_server.call_tool = AsyncMock()
+
+        client = MultiServerClient.from_dict(sample_config_dict)
+        client.sessions = {"server1": mock_tool_server, "server2": other_server}
+        for server_name in client.sessions:
+            client._register_capabilities(
+                server_name, ServerCapabilities(name=server_name, tools=ListToolsResult(tools=sample_tools))
+            )
+
+        result = await client.call_tool("server1:get_weather", {"location": "Paris"})
+
+        assert result.isError is False
+        mock_tool_server.call_tool.assert_called_once()
+        assert mock_tool_server.call_tool.call_args.args[0] == "get_weather"
+        other_server.call_tool.assert_not_called()
+
+        result = await client.call_tool("server1:unknown_tool", {})
+        assert result.isError is True
+        assert "Unknown tool" in result.content[0].text
+
 
 class TestErrorHandling:
     """Tests for error handling scenarios."""
@@ -0,0 +1,38 @@
+"""Tests for the examples' single-server session helper."""
+
+from unittest.mock import (
+    AsyncMock,
+    MagicMock,
+    patch,
+)
+
+import pytest
+
+from examples.support.mcp_session import mcp_session
+from mcp import StdioServerParameters
+
+
+class TestMcpSession:
+    """Tests for mcp_session context manager."""
+
+    @pytest.mark.asyncio
+    async def test_session_spawned_once_and_initialized(self) -> None:
+        """Test that one subprocess and session are opened and reused."""
+        params = StdioServerParameters(command="python", args=["-m", "my_server"])
+
+        with patch("examples.support.mcp_session.stdio_client") as mock_stdio:
+            mock_stdio.return_value.__aenter__ = AsyncMock(return_value=(MagicMock(), MagicMock()))
+            mock_stdio.return_value.__aexit__ = AsyncMock()
+
+            with patch("examples.support.mcp_session.ClientSession") as mock_session_class:
+                mock_session = MagicMock()
+                mock_session.initialize = AsyncMock()
+                mock_session_class.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+                mock_session_class.return_value.__aexit__ = AsyncMock()
+
+                async with mcp_session(params) as session:
+                    assert session is mock_session
+
+        mock_stdio.assert_called_once_with(params)
+        mock_session_class.assert_called_once()
+        mock_session.initialize.assert_awaited_once()
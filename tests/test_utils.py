@@ -124,6 +124,46 @@ class TestMcpToolsToOpenaiFormat:
         assert len(result) == 1
         assert result[0]["function"]["parameters"]["properties"] == {}
 
+    def test_repeated_conversion_reuses_cached_definitions(self) -> None:
+        """Test that converting the same tools twice returns the cached dicts."""
+        mcp_tools = [
+            Tool(
+                name="get_weather",
+                description="Get weather",
+                inputSchema={"type": "object", "properties": {}}
+            )
+        ]
+
+        first = mcp_tools_to_openai_format(mcp_tools)
+        second = mcp_tools_to_openai_format(mcp_tools)
+
+        assert first[0] is second[0]
+
+    def test_reassigned_tool_fields_are_converted_again(self) -> None:
+        """Test that a Tool changed in place does not return its stale definition."""
+        tool = Tool(name="get_weather", description="Get weather", inputSchema={"type": "object"})
+
+        first = mcp_tools_to_openai_format([tool])
+        tool.description = "Get the current weather"
+        second = mcp_tools_to_openai_format([tool])
+
+        assert second[0] is not first[0]
+        assert second[0]["function"]["description"] == "Get the current weather"
+
+    def test_same_name_with_different_schema_not_shared(self) -> None:
+        """Test that tools with equal names but distinct schemas get distinct definitions."""
+        tool_a = Tool(name="search", description="Search", inputSchema={"type": "object", "properties": {}})
+        tool_b = Tool(
+            name="search",
+            description="Search",
+            inputSchema={"type": "object", "properties": {"q": {"type": "string"}}}
+        )
+
+        result = mcp_tools_to_openai_format([tool_a, tool_b])
+
+        assert result[0]["function"]["parameters"] is tool_a.inputSchema
+        assert result[1]["function"]["parameters"] is tool_b.inputSchema
+
 
 class TestFormatNamespaceUri:
     """Tests for format_namespace_uri function."""
@@ -378,3 +418,12 @@ class TestSubstituteTemplateVariables:
         # Unicode characters should be URL-encoded
         assert "test" in result
         assert "%C3%A9" in result  # é encoded
+
+    def test_substitute_repeated_variable(self) -> None:
+        """Test that every occurrence of a repeated variable is substituted."""
+        result = substitute_template_variables(
+            "users/{id}/posts/{id}",
+            {"id": "a b"}
+        )
+
+        assert result == "users/a%20b/posts/a%20b"